@@ -17,23 +17,78 @@ the aforementioned script.
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
+from __future__ import annotations
+
 import hashlib
 import re
+from collections.abc import Mapping
 from datetime import datetime, timezone
-from typing import Union
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Union
 
 import pytest
 import responses
+from responses import registries
 
-import xbrl_filings_api as xf
 from tests.urlmock import UrlMock
-from xbrl_filings_api import FilingSet, ResourceCollection
-from xbrl_filings_api.api_request import APIRequest
+
+if TYPE_CHECKING:
+    from xbrl_filings_api import FilingSet, ResourceCollection
 
 UTC = timezone.utc
 
 MOCK_URL_DIR_NAME = 'mock_responses'
 
+CASSETTE_CACHE_FILE_NAME = '.cassette_cache.pickle'
+
+
+def pytest_addoption(parser):
+    """Add custom command line options to pytest."""
+    parser.addoption(
+        '--use-cassette-cache',
+        action='store_true',
+        help=(
+            'Persist parsed mock URL response parameters in a pickle '
+            'file between test runs.'
+            )
+        )
+    parser.addoption(
+        '--sqlite-tmpfs',
+        action='store_true',
+        help=(
+            'Write test databases and SQLite temporary files to tmpfs '
+            '(/dev/shm) when available.'
+            )
+        )
+
+
+def pytest_collection_modifyitems():
+    """Warm the `xbrl_filings_api` import once before tests run."""
+    import xbrl_filings_api  # noqa: F401
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _cassette_cache(request):
+    """Load and save the persistent mock URL response parse cache."""
+    if not request.config.getoption('--use-cassette-cache'):
+        yield
+        return
+    from pathlib import Path
+
+    from tests import urlmock as urlmock_module
+    cache_path = Path(__file__).parent / CASSETTE_CACHE_FILE_NAME
+    urlmock_module.load_params_cache(cache_path)
+    yield
+    urlmock_module.save_params_cache(cache_path)
+
+_MOCK_RESPONSE_BYTES = b'0123456789' * 100
+_MOCK_RESPONSE_DATA = _MOCK_RESPONSE_BYTES.decode(encoding='utf-8')
+_hasher = hashlib.sha256(usedforsecurity=False)
+_hasher.update(_MOCK_RESPONSE_BYTES)
+_MOCK_RESPONSE_SHA256_DIGEST = _hasher.digest()
+_MOCK_RESPONSE_SHA256 = _MOCK_RESPONSE_SHA256_DIGEST.hex()
+del _hasher
+
 
 @pytest.fixture(scope='package')
 def urlmock() -> UrlMock:
@@ -48,140 +103,251 @@ def urlmock() -> UrlMock:
         Apply the mock URL response on the test for requests library.
     """
     instance = UrlMock()
+    instance.preload()
     return instance
 
 
 @pytest.fixture
 def filings() -> FilingSet:
     """Empty FilingSet."""
+    from xbrl_filings_api import FilingSet
     return FilingSet()
 
 
 @pytest.fixture
-def res_colls(filings) -> dict[str, ResourceCollection]:
-    """Subresource collections as dict, keyed with class names."""
-    return {
+def res_colls(filings) -> Mapping[str, ResourceCollection]:
+    """Subresource collections as mapping, keyed with class names."""
+    return MappingProxyType({
         'Entity': filings.entities,
         'ValidationMessage': filings.validation_messages
-        }
+        })
+
+
+_COUNT_FILINGS_SQL = "SELECT COUNT(*) FROM Filing"
+
+
+@pytest.fixture(scope='session')
+def sqlite_tmp_dir(request, tmp_path_factory):
+    """
+    Session-wide directory for databases written by to_sqlite tests.
+
+    Amortizes the per-test tmp_path directory creation. Database file
+    names must be unique, suffix them with ``uuid4().hex[:8]``. With
+    command line option ``--sqlite-tmpfs`` the directory is created on
+    tmpfs (``/dev/shm``) and ``SQLITE_TMPDIR`` is pointed there, which
+    keeps all SQLite I/O of the tests in RAM.
+    """
+    import os
+    import shutil
+    import tempfile
+    from pathlib import Path
+    shm_path = Path('/dev/shm')  # noqa: S108 # Opt-in tmpfs for test dbs
+    if not (request.config.getoption('--sqlite-tmpfs')
+            and shm_path.is_dir()):
+        yield tmp_path_factory.mktemp('sqlite_tests')
+        return
+    temp_dir = tempfile.mkdtemp(prefix='sqlite_tests_', dir=shm_path)
+    orig_sqlite_tmpdir = os.environ.get('SQLITE_TMPDIR')
+    os.environ['SQLITE_TMPDIR'] = temp_dir
+    yield Path(temp_dir)
+    if orig_sqlite_tmpdir is None:
+        del os.environ['SQLITE_TMPDIR']
+    else:
+        os.environ['SQLITE_TMPDIR'] = orig_sqlite_tmpdir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sqlite_connect(request, monkeypatch):
+    """
+    Disable journaling and fsync for databases of ``sqlite`` tests.
+
+    Patches `sqlite3.connect` so the connection opened inside
+    `to_sqlite` skips the rollback journal and fsync, cutting the
+    write amplification of the ephemeral test databases. Applied only
+    to tests carrying the ``sqlite`` marker.
+    """
+    if request.node.get_closest_marker('sqlite') is None:
+        yield
+        return
+    import sqlite3
+    orig_connect = sqlite3.connect
+    def _connect(*args, **kwargs):
+        con = orig_connect(*args, **kwargs)
+        con.executescript(
+            "PRAGMA journal_mode = MEMORY;"
+            "PRAGMA synchronous = OFF;"
+            "PRAGMA temp_store = MEMORY;"
+            )
+        return con
+    monkeypatch.setattr(sqlite3, 'connect', _connect)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _disable_views(request, monkeypatch):
+    """
+    Set `options.views` to None for ``sqlite`` tests.
+
+    The to_sqlite tests verify table contents and do not need the
+    default views. Tests exercising `options.views` override the value
+    with their own ``monkeypatch.setattr`` call.
+    """
+    if request.node.get_closest_marker('sqlite') is None:
+        return
+    from xbrl_filings_api import options
+    monkeypatch.setattr(options, 'views', None)
+
+
+@pytest.fixture(scope='package')
+def open_test_db():
+    """
+    Connect a test database with journaling and fsync disabled.
+
+    Returns a function opening the SQLite3 database in the given path
+    and returning ``(con, cur)``. The pragmas skip rollback journal
+    and fsync setup, which dominates the sub-second verification
+    queries on the ephemeral databases written by ``to_sqlite`` tests.
+    """
+    import sqlite3
+    def _open_test_db(db_path):
+        # isolation_level=None skips the implicit BEGIN on first SELECT
+        con = sqlite3.connect(db_path, isolation_level=None)
+        cur = con.cursor()
+        cur.execute("PRAGMA journal_mode = MEMORY")
+        cur.execute("PRAGMA synchronous = OFF")
+        cur.execute("PRAGMA temp_store = MEMORY")
+        return con, cur
+    return _open_test_db
 
 
 @pytest.fixture(scope='package')
 def db_record_count():
     """Get total count of database records in Filing table."""
     def _db_record_count(cur):
-        cur.execute("SELECT COUNT(*) FROM Filing")
-        return cur.fetchone()[0]
+        return cur.execute(_COUNT_FILINGS_SQL).fetchone()[0]
     return _db_record_count
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def mock_response_data():
     """Arbitrary data for mock download, 1000 chars."""
-    return '0123456789' * 100
+    return _MOCK_RESPONSE_DATA
 
 
-@pytest.fixture(scope='module')
-def mock_response_sha256(mock_response_data):
+@pytest.fixture(scope='session')
+def mock_response_sha256():
     """SHA-256 hash for fixture mock_response_data."""
-    fhash = hashlib.sha256(
-        string=mock_response_data.encode(encoding='utf-8'),
-        usedforsecurity=False
-        )
-    return fhash.hexdigest()
+    return _MOCK_RESPONSE_SHA256
 
 
 @pytest.fixture(scope='module')
-def mock_url_response(mock_response_data):
+def mock_url_response():
     """Add a `responses` mock URL with fixt mock_response_data body."""
     def _mock_url_response(
-            url: str, rsps: Union[responses.RequestsMock, None] = None):
-        if rsps is None:
-            rsps = responses
+            url: str,
+            rsps: Union[responses.RequestsMock, ModuleType] = responses):
         rsps.add(
             method=responses.GET,
             url=url,
-            body=mock_response_data,
+            body=_MOCK_RESPONSE_DATA,
             headers={}
             )
     return _mock_url_response
 
 
-@pytest.fixture(scope='package')
-def get_oldest3_fi_filingset(urlmock):
-    """Get FilingSet from mock response oldest3_fi."""
-    def _get_oldest3_fi_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi')
+@pytest.fixture(scope='module')
+def bulk_mock_url_responses():
+    """Add `responses` mock URLs with fixt mock_response_data body."""
+    def _bulk_mock_url_responses(
+            urls,
+            rsps: Union[responses.RequestsMock, ModuleType] = responses):
+        registry = getattr(rsps, 'mock', rsps)._registry
+        registry.registered.extend(
+            responses.Response(
+                method=responses.GET, url=url, body=_MOCK_RESPONSE_DATA)
+            for url in urls
+            )
+    return _bulk_mock_url_responses
+
+
+_oldest3_fi_filingset_cache = {}
+"""FilingSet objects of ``oldest3_fi*`` mocks, keyed by mock name."""
+
+_oldest3_fi_rsps = responses.RequestsMock()
+"""Shared RequestsMock for building ``oldest3_fi*`` filing sets."""
+
+
+def _get_cached_oldest3_fi_filingset(urlmock, urlmock_name, flags):
+    """
+    Get deep copy of the FilingSet from mock `urlmock_name`.
+
+    The mocked queries are deterministic so the query pipeline is run
+    once per mock for the test run. Each call returns a deep copy of
+    the cached set so tests may freely mutate the returned set.
+    """
+    import xbrl_filings_api as xf
+    fs = _oldest3_fi_filingset_cache.get(urlmock_name)
+    if fs is None:
+        with _oldest3_fi_rsps as rsps:
+            urlmock.apply(rsps, urlmock_name)
             fs = xf.get_filings(
                 filters={'country': 'FI'},
                 sort='date_added',
                 limit=3,
-                flags=xf.GET_ONLY_FILINGS,
+                flags=flags,
                 add_api_params=None
                 )
-        return fs
+        _oldest3_fi_filingset_cache[urlmock_name] = fs
+    # Argless union() returns a deep copy of the set contents
+    return fs.union()
+
+
+@pytest.fixture(scope='package')
+def get_oldest3_fi_filingset(urlmock):
+    """Get FilingSet from mock response oldest3_fi."""
+    import xbrl_filings_api as xf
+    def _get_oldest3_fi_filingset():
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi', xf.GET_ONLY_FILINGS)
     return _get_oldest3_fi_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_entities_filingset(urlmock):
     """Get FilingSet from mock response oldest3_fi_entities."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_entities_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_entities')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=xf.GET_ENTITY,
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_entities', xf.GET_ENTITY)
     return _get_oldest3_fi_entities_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_vmessages_filingset(urlmock):
     """Get FilingSet from mock response oldest3_fi_vmessages."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_vmessages_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_vmessages')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=xf.GET_VALIDATION_MESSAGES,
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_vmessages', xf.GET_VALIDATION_MESSAGES)
     return _get_oldest3_fi_vmessages_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_ent_vmessages_filingset(urlmock):
     """Get FilingSet from mock response ``oldest3_fi_ent_vmessages``."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_ent_vmessages_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_ent_vmessages')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES),
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_ent_vmessages',
+            xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
     return _get_oldest3_fi_ent_vmessages_filingset
 
 
 @pytest.fixture(scope='package')
 def dummy_api_request():
     """Dummy APIRequest object."""
+    from xbrl_filings_api.api_request import APIRequest
     return APIRequest(
         'https://filings.xbrl.org/api/filings?Dummy=Url',
         query_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=UTC)
@@ -204,463 +370,180 @@ def all_test_functions(request):
     return test_funcs
 
 
-@pytest.fixture
-def creditsuisse21en_by_id_response(urlmock):
-    """Credit Suisse 2021 English AFR filing by `api_id`."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'creditsuisse21en_by_id')
-        yield rsps
-
-
-@pytest.fixture
-def creditsuisse21en_by_id_entity_response(urlmock):
-    """
-    Credit Suisse 2021 English AFR filing by `api_id` and with Entity.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'creditsuisse21en_by_id_entity')
-        yield rsps
-
-
-@pytest.fixture
-def asml22en_response(urlmock):
-    """ASML Holding 2022 English AFR filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'asml22en')
-        yield rsps
-
-
-@pytest.fixture
-def asml22en_entities_response(urlmock):
-    """ASML Holding 2022 English AFR filing with entity."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'asml22en_entities')
-        yield rsps
-
-
-@pytest.fixture
-def asml22en_vmessages_response(urlmock):
-    """ASML Holding 2022 English AFR filing with validation messages."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'asml22en_vmessages')
-        yield rsps
-
-
-@pytest.fixture
-def assicurazioni21it_vmessages_response(urlmock):
-    """
-    Assicurazioni Generali 2021 Italian AFR filing with validation
-    messages.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'assicurazioni21it_vmessages')
-        yield rsps
-
-
-@pytest.fixture
-def tecnotree21fi_vmessages_response(urlmock):
-    """Tecnotree 2021 Finnish AFR filing with validation messages."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'tecnotree21fi_vmessages')
-        yield rsps
-
-
-@pytest.fixture
-def asml22en_ent_vmsg_response(urlmock):
-    """
-    ASML Holding 2022 English AFR filing with entities and v-messages.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'asml22en_ent_vmsg')
-        yield rsps
-
-
-@pytest.fixture
-def filter_language_response(urlmock):
-    """Filter by language 'fi'."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_language')
-        yield rsps
-
-
-@pytest.fixture
-def filter_last_end_date_response(urlmock):
-    """Filter by last_end_date '2021-02-28'."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_last_end_date')
-        yield rsps
-
-
-@pytest.fixture
-def filter_last_end_date_lax_response(urlmock):
-    """Filter by last_end_date '2021-02-28'."""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        urlmock.apply(rsps, 'filter_last_end_date')
-        yield rsps
-
-
-@pytest.fixture
-def filter_error_count_response(urlmock):
-    """Filter by error_count value 0."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_error_count')
-        yield rsps
-
-
-@pytest.fixture
-def filter_inconsistency_count_response(urlmock):
-    """Filter by `inconsistency_count` value 0."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_inconsistency_count')
-        yield rsps
-
-
-@pytest.fixture
-def filter_warning_count_response(urlmock):
-    """Filter by warning_count value 0."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_warning_count')
-        yield rsps
-
-
-@pytest.fixture
-def filter_added_time_response(urlmock):
-    """Filter by added_time value '2021-09-23 00:00:00'."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_added_time')
-        yield rsps
-
-
-@pytest.fixture
-def filter_added_time_lax_response(urlmock):
-    """Filter by added_time value '2021-09-23 00:00:00'."""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        urlmock.apply(rsps, 'filter_added_time')
-        yield rsps
-
-
-@pytest.fixture
-def filter_added_time_2_response(urlmock):
-    """Filter by added_time value '2023-05-09 13:27:02.676029'."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_added_time_2')
-        yield rsps
-
-
-@pytest.fixture
-def filter_entity_api_id_response(urlmock):
-    """Return error when filtering with `entity_api_id`."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_entity_api_id')
-        yield rsps
-
-
-@pytest.fixture
-def filter_entity_api_id_lax_response(urlmock):
-    """Return error when filtering with `entity_api_id`."""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        urlmock.apply(rsps, 'filter_entity_api_id')
-        yield rsps
-
-
-@pytest.fixture
-def filter_json_url_response(urlmock):
-    """Filter by json_url of Kone 2022 [en] filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_json_url')
-        yield rsps
-
-
-@pytest.fixture
-def filter_package_url_response(urlmock):
-    """Filter by package_url of Kone 2022 [en] filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_package_url')
-        yield rsps
-
-
-@pytest.fixture
-def filter_viewer_url_response(urlmock):
-    """Filter by viewer_url of Kone 2022 [en] filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_viewer_url')
-        yield rsps
-
-
-@pytest.fixture
-def filter_xhtml_url_response(urlmock):
-    """Filter by xhtml_url of Kone 2022 [en] filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_xhtml_url')
-        yield rsps
-
-
-@pytest.fixture
-def filter_package_sha256_response(urlmock):
-    """Filter by package_sha256 of Kone 2022 filing."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'filter_package_sha256')
-        yield rsps
-
-
-@pytest.fixture
-def finnish_jan22_response(urlmock):
-    """Finnish AFR filings with reporting period ending in Jan 2022."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'finnish_jan22')
-        yield rsps
-
-
-@pytest.fixture
-def oldest3_fi_response(urlmock):
-    """Oldest 3 AFR filings reported in Finland."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'oldest3_fi')
-        yield rsps
-
-
-@pytest.fixture
-def oldest3_fi_entities_response(urlmock):
-    """Oldest 3 AFR filings reported in Finland with entities."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'oldest3_fi_entities')
-        yield rsps
-
-
-@pytest.fixture
-def oldest3_fi_vmessages_response(urlmock):
-    """
-    Oldest 3 AFR filings reported in Finland with validation messages.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'oldest3_fi_vmessages')
-        yield rsps
-
-
-@pytest.fixture
-def oldest3_fi_ent_vmessages_response(urlmock):
-    """
-    Oldest 3 AFR filings reported in Finland with entities and
-    validation messages.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'oldest3_fi_ent_vmessages')
-        yield rsps
-
-
-@pytest.fixture
-def sort_two_fields_response(urlmock):
-    """
-    Sort Finnish filings by `last_end_date` and `added_time`. WARNING,
-    volatile with ``mock_upgrade.py`` run. See test
-    ``test_query_sort::test_sort_two_fields``.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'sort_two_fields')
-        yield rsps
-
-
-@pytest.fixture
-def paging_swedish_size2_pg3_response(urlmock):
-    """
-    Get 3 pages, actually 4, (pg size 2) of oldest Swedish filings.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'paging_swedish_size2_pg3')
-        yield rsps
-
-
-@pytest.fixture
-def paging_swedish_size2_pg3_lax_response(urlmock):
-    """
-    Get 3 pages, actually 4, (pg size 2) of oldest Swedish filings.
-    """
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        urlmock.apply(rsps, 'paging_swedish_size2_pg3')
-        yield rsps
-
-
-@pytest.fixture
-def paging_oldest_ukrainian_2pg_4ea_response(urlmock):
-    """Get oldest Ukrainian filings 2 pages, 4 filings each."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'paging_oldest_ukrainian_2pg_4ea')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_api_id_response(urlmock):
-    """Get 4 Shell filings for 2021 and 2022."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_api_id')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_api_id_entities_response(urlmock):
-    """Get 4 Shell filings for 2021 and 2022 with entities."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_api_id_entities')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_country_response(urlmock):
-    """Get three filings for the country `FI`."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_country')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_filing_index_response(urlmock):
-    """Get both Shell 2021 filings filtered with filing_index."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_filing_index')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_reporting_date_response(urlmock):
-    """Return an error for filtering with `reporting_date`."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_reporting_date')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_processed_time_response(urlmock):
-    """Get two filings filtered with `processed_time`."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_processed_time')
-        yield rsps
-
-
-@pytest.fixture
-def unknown_filter_error_response(urlmock):
-    """Get an error of unknown filter."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'unknown_filter_error')
-        yield rsps
-
-
-@pytest.fixture
-def bad_page_error_response(urlmock):
-    """Get an error of page number -1."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'bad_page_error')
-        yield rsps
-
-
-@pytest.fixture
-def fortum23fi_xhtml_language_response(urlmock):
-    """Fortum 2023 Finnish AFR filing with language in xhtml_url."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'fortum23fi_xhtml_language')
-        yield rsps
-
-
-@pytest.fixture
-def paging_czechia20dec_response(urlmock):
-    """Czech 2020-12-31 AFRs."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'paging_czechia20dec')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_belgium20_short_date_year_response(urlmock):
-    """
-    Belgian 2020 AFRs querying with short date filter year,
-    limit=100.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_belgium20_short_date_year')
-        yield rsps
-
-
-@pytest.fixture
-def multifilter_belgium20_short_date_year_no_limit_response(urlmock):
-    """
-    Belgian 2020 AFRs querying with short date filter year,
-    limit=NO_LIMIT, options.max_page_size=200.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'multifilter_belgium20_short_date_year_no_limit')
-        yield rsps
-
-
-@pytest.fixture
-def sort_asc_package_sha256_latvia_response(urlmock):
-    """Sorted ascending by package_sha256 from Latvian records."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'sort_asc_package_sha256_latvia')
-        yield rsps
-
-
-@pytest.fixture
-def sort_desc_package_sha256_latvia_response(urlmock):
-    """Sorted ascending by package_sha256 from Latvian records."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'sort_desc_package_sha256_latvia')
-        yield rsps
-
-
-@pytest.fixture
-def kone22_all_languages_response(urlmock):
-    """Sorted ascending by package_sha256 from Latvian records."""
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'kone22_all_languages')
-        yield rsps
-
-
-@pytest.fixture
-def estonian_2_pages_3_each_response(urlmock):
-    """
-    Estonian filings 2 pages of size 3, incl. entities, v-messages.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'estonian_2_pages_3_each')
-        yield rsps
-
-
-@pytest.fixture
-def ageas21_22_response(urlmock):
-    """
-    Ageas 2021 and 2022 filings in 3 languages (nl, fr, en) with
-    entities, 6 filings.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'ageas21_22')
-        yield rsps
-
-
-@pytest.fixture
-def applus20_21_response(urlmock):
-    """
-    Applus Services 2020, 2021 filings with entities, 2 filings, same
-    last_end_date.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'applus20_21')
-        yield rsps
-
-
-@pytest.fixture
-def upm21to22_response(urlmock):
-    """
-    UPM-Kymmene 2021 to 2022 filings (en, fi) with entities, 4 filings.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'upm21to22')
-        yield rsps
-
-
-@pytest.fixture
-def upm22to23_response(urlmock):
-    """
-    UPM-Kymmene 2022 to 2023 filings (en, fi) with entities, 4 filings.
-    """
-    with responses.RequestsMock() as rsps:
-        urlmock.apply(rsps, 'upm22to23')
-        yield rsps
+@pytest.fixture(scope='session')
+def _session_requests_mock():
+    """
+    Session-wide started `RequestsMock` for the URL mock fixtures.
+
+    The requests library is patched once for the whole session instead
+    of patching and unpatching around every test. The URL mock fixtures
+    reset the registered responses around each test.
+    """
+    rsps = responses.RequestsMock()
+    rsps.start()
+    yield rsps
+    rsps.stop(allow_assert=False)
+    rsps.reset()
+
+
+def _make_url_mock_fixture(name, *, islax, ordered, docstring):
+    """
+    Create a URL mock response fixture for mock collection `name`.
+
+    The created fixtures are registered from table
+    ``_URL_MOCK_FIXTURES`` generated by script ``mock_upgrade.py`` to
+    the end of ``conftest.py``. Fixtures are named ``<name>_response``
+    and for lax fixtures ``<name>_lax_response``. The lax fixtures do
+    not assert that all requests are fired and are used when the test
+    function should raise (other than APIError) and not necessarily
+    initiate all of the URL requests. Ordered fixtures match the
+    responses in strict registration order which skips first-match
+    scanning for deterministic paginated mocks.
+    """
+    fixt_name = f'{name}_lax_response' if islax else f'{name}_response'
+
+    @pytest.fixture(name=fixt_name)
+    def _url_mock_response(urlmock, _session_requests_mock):
+        rsps = _session_requests_mock
+        rsps.reset()
+        if ordered:
+            rsps._set_registry(registries.OrderedRegistry)
+        urlmock.apply(rsps, name)
+        yield rsps
+        not_called = [] if islax else [
+            match for match in rsps.registered() if match.call_count == 0]
+        rsps.reset()
+        if not_called:
+            missed = [(match.method, match.url) for match in not_called]
+            msg = f'Not all requests have been executed {missed!r}'
+            raise AssertionError(msg)
+
+    _url_mock_response.__name__ = fixt_name
+    _url_mock_response.__doc__ = docstring
+    return _url_mock_response
+
+_URL_MOCK_FIXTURES = [
+    ('creditsuisse21en_by_id', False, False,
+     'Credit Suisse 2021 English AFR filing by `api_id`.'),
+    ('creditsuisse21en_by_id_entity', False, False,
+     ('Credit Suisse 2021 English AFR filing by `api_id` and with '
+      'Entity.')),
+    ('asml22en', False, False,
+     'ASML Holding 2022 English AFR filing.'),
+    ('asml22en_entities', False, False,
+     'ASML Holding 2022 English AFR filing with entity.'),
+    ('asml22en_vmessages', False, False,
+     ('ASML Holding 2022 English AFR filing with validation '
+      'messages.')),
+    ('assicurazioni21it_vmessages', False, False,
+     ('Assicurazioni Generali 2021 Italian AFR filing with '
+      'validation messages.')),
+    ('tecnotree21fi_vmessages', False, False,
+     'Tecnotree 2021 Finnish AFR filing with validation messages.'),
+    ('asml22en_ent_vmsg', False, False,
+     ('ASML Holding 2022 English AFR filing with entities and '
+      'v-messages.')),
+    ('filter_language', False, False,
+     "Filter by language 'fi'."),
+    ('filter_last_end_date', True, False,
+     "Filter by last_end_date '2021-02-28'."),
+    ('filter_error_count', False, False,
+     'Filter by error_count value 0.'),
+    ('filter_inconsistency_count', False, False,
+     'Filter by `inconsistency_count` value 0.'),
+    ('filter_warning_count', False, False,
+     'Filter by warning_count value 0.'),
+    ('filter_added_time', True, False,
+     "Filter by added_time value '2021-09-23 00:00:00'."),
+    ('filter_added_time_2', False, False,
+     "Filter by added_time value '2023-05-09 13:27:02.676029'."),
+    ('filter_entity_api_id', True, False,
+     'Return error when filtering with `entity_api_id`.'),
+    ('filter_json_url', False, False,
+     'Filter by json_url of Kone 2022 [en] filing.'),
+    ('filter_package_url', False, False,
+     'Filter by package_url of Kone 2022 [en] filing.'),
+    ('filter_viewer_url', False, False,
+     'Filter by viewer_url of Kone 2022 [en] filing.'),
+    ('filter_xhtml_url', False, False,
+     'Filter by xhtml_url of Kone 2022 [en] filing.'),
+    ('filter_package_sha256', False, False,
+     'Filter by package_sha256 of Kone 2022 filing.'),
+    ('finnish_jan22', False, False,
+     ('Finnish AFR filings with reporting period ending in Jan '
+      '2022.')),
+    ('oldest3_fi', False, False,
+     'Oldest 3 AFR filings reported in Finland.'),
+    ('oldest3_fi_entities', False, False,
+     'Oldest 3 AFR filings reported in Finland with entities.'),
+    ('oldest3_fi_vmessages', False, False,
+     ('Oldest 3 AFR filings reported in Finland with validation '
+      'messages.')),
+    ('oldest3_fi_ent_vmessages', False, False,
+     ('Oldest 3 AFR filings reported in Finland with entities and '
+      'validation messages.')),
+    ('sort_two_fields', False, False,
+     ('Sort Finnish filings by `last_end_date` and `added_time`. '
+      'WARNING, volatile with ``mock_upgrade.py`` run. See test '
+      '``test_query_sort::test_sort_two_fields``.')),
+    ('paging_swedish_size2_pg3', True, True,
+     ('Get 3 pages, actually 4, (pg size 2) of oldest Swedish '
+      'filings.')),
+    ('paging_oldest_ukrainian_2pg_4ea', False, True,
+     'Get oldest Ukrainian filings 2 pages, 4 filings each.'),
+    ('multifilter_api_id', False, False,
+     'Get 4 Shell filings for 2021 and 2022.'),
+    ('multifilter_api_id_entities', False, False,
+     'Get 4 Shell filings for 2021 and 2022 with entities.'),
+    ('multifilter_country', False, False,
+     'Get three filings for the country `FI`.'),
+    ('multifilter_filing_index', False, False,
+     'Get both Shell 2021 filings filtered with filing_index.'),
+    ('multifilter_reporting_date', False, False,
+     'Return an error for filtering with `reporting_date`.'),
+    ('multifilter_processed_time', False, False,
+     'Get two filings filtered with `processed_time`.'),
+    ('unknown_filter_error', False, False,
+     'Get an error of unknown filter.'),
+    ('bad_page_error', False, False,
+     'Get an error of page number -1.'),
+    ('fortum23fi_xhtml_language', False, False,
+     'Fortum 2023 Finnish AFR filing with language in xhtml_url.'),
+    ('paging_czechia20dec', False, True,
+     'Czech 2020-12-31 AFRs.'),
+    ('multifilter_belgium20_short_date_year', False, False,
+     ('Belgian 2020 AFRs querying with short date filter year, '
+      'limit=100.')),
+    ('multifilter_belgium20_short_date_year_no_limit', False, False,
+     ('Belgian 2020 AFRs querying with short date filter year, '
+      'limit=NO_LIMIT, options.max_page_size=200.')),
+    ('sort_asc_package_sha256_latvia', False, False,
+     'Sorted ascending by package_sha256 from Latvian records.'),
+    ('sort_desc_package_sha256_latvia', False, False,
+     'Sorted ascending by package_sha256 from Latvian records.'),
+    ('kone22_all_languages', False, False,
+     'Sorted ascending by package_sha256 from Latvian records.'),
+    ('estonian_2_pages_3_each', False, True,
+     ('Estonian filings 2 pages of size 3, incl. entities, '
+      'v-messages.')),
+    ('ageas21_22', False, False,
+     ('Ageas 2021 and 2022 filings in 3 languages (nl, fr, en) with '
+      'entities, 6 filings.')),
+    ('applus20_21', False, False,
+     ('Applus Services 2020, 2021 filings with entities, 2 filings, '
+      'same last_end_date.')),
+    ('upm21to22', False, False,
+     ('UPM-Kymmene 2021 to 2022 filings (en, fi) with entities, 4 '
+      'filings.')),
+    ('upm22to23', False, False,
+     ('UPM-Kymmene 2022 to 2023 filings (en, fi) with entities, 4 '
+      'filings.')),
+    ]
+
+for _mock_name, _mock_islax, _mock_ordered, _mock_doc in _URL_MOCK_FIXTURES:
+    globals()[f'{_mock_name}_response'] = _make_url_mock_fixture(
+        _mock_name, islax=False, ordered=_mock_ordered, docstring=_mock_doc)
+    if _mock_islax:
+        globals()[f'{_mock_name}_lax_response'] = _make_url_mock_fixture(
+            _mock_name, islax=True, ordered=_mock_ordered,
+            docstring=_mock_doc)
@@ -17,23 +17,78 @@ flag ``-n`` / ``--new``).
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
+from __future__ import annotations
+
 import hashlib
 import re
+from collections.abc import Mapping
 from datetime import datetime, timezone
-from typing import Union
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Union
 
 import pytest
 import responses
+from responses import registries
 
-import xbrl_filings_api as xf
 from tests.urlmock import UrlMock
-from xbrl_filings_api import FilingSet, ResourceCollection
-from xbrl_filings_api.api_request import APIRequest
+
+if TYPE_CHECKING:
+    from xbrl_filings_api import FilingSet, ResourceCollection
 
 UTC = timezone.utc
 
 MOCK_URL_DIR_NAME = 'mock_responses'
 
+CASSETTE_CACHE_FILE_NAME = '.cassette_cache.pickle'
+
+
+def pytest_addoption(parser):
+    """Add custom command line options to pytest."""
+    parser.addoption(
+        '--use-cassette-cache',
+        action='store_true',
+        help=(
+            'Persist parsed mock URL response parameters in a pickle '
+            'file between test runs.'
+            )
+        )
+    parser.addoption(
+        '--sqlite-tmpfs',
+        action='store_true',
+        help=(
+            'Write test databases and SQLite temporary files to tmpfs '
+            '(/dev/shm) when available.'
+            )
+        )
+
+
+def pytest_collection_modifyitems():
+    """Warm the `xbrl_filings_api` import once before tests run."""
+    import xbrl_filings_api  # noqa: F401
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _cassette_cache(request):
+    """Load and save the persistent mock URL response parse cache."""
+    if not request.config.getoption('--use-cassette-cache'):
+        yield
+        return
+    from pathlib import Path
+
+    from tests import urlmock as urlmock_module
+    cache_path = Path(__file__).parent / CASSETTE_CACHE_FILE_NAME
+    urlmock_module.load_params_cache(cache_path)
+    yield
+    urlmock_module.save_params_cache(cache_path)
+
+_MOCK_RESPONSE_BYTES = b'0123456789' * 100
+_MOCK_RESPONSE_DATA = _MOCK_RESPONSE_BYTES.decode(encoding='utf-8')
+_hasher = hashlib.sha256(usedforsecurity=False)
+_hasher.update(_MOCK_RESPONSE_BYTES)
+_MOCK_RESPONSE_SHA256_DIGEST = _hasher.digest()
+_MOCK_RESPONSE_SHA256 = _MOCK_RESPONSE_SHA256_DIGEST.hex()
+del _hasher
+
 
 @pytest.fixture(scope='package')
 def urlmock() -> UrlMock:
@@ -48,140 +103,251 @@ def urlmock() -> UrlMock:
         Apply the mock URL response on the test for requests library.
     """
     instance = UrlMock()
+    instance.preload()
     return instance
 
 
 @pytest.fixture
 def filings() -> FilingSet:
     """Empty FilingSet."""
+    from xbrl_filings_api import FilingSet
     return FilingSet()
 
 
 @pytest.fixture
-def res_colls(filings) -> dict[str, ResourceCollection]:
-    """Subresource collections as dict, keyed with class names."""
-    return {
+def res_colls(filings) -> Mapping[str, ResourceCollection]:
+    """Subresource collections as mapping, keyed with class names."""
+    return MappingProxyType({
         'Entity': filings.entities,
         'ValidationMessage': filings.validation_messages
-        }
+        })
+
+
+_COUNT_FILINGS_SQL = "SELECT COUNT(*) FROM Filing"
+
+
+@pytest.fixture(scope='session')
+def sqlite_tmp_dir(request, tmp_path_factory):
+    """
+    Session-wide directory for databases written by to_sqlite tests.
+
+    Amortizes the per-test tmp_path directory creation. Database file
+    names must be unique, suffix them with ``uuid4().hex[:8]``. With
+    command line option ``--sqlite-tmpfs`` the directory is created on
+    tmpfs (``/dev/shm``) and ``SQLITE_TMPDIR`` is pointed there, which
+    keeps all SQLite I/O of the tests in RAM.
+    """
+    import os
+    import shutil
+    import tempfile
+    from pathlib import Path
+    shm_path = Path('/dev/shm')  # noqa: S108 # Opt-in tmpfs for test dbs
+    if not (request.config.getoption('--sqlite-tmpfs')
+            and shm_path.is_dir()):
+        yield tmp_path_factory.mktemp('sqlite_tests')
+        return
+    temp_dir = tempfile.mkdtemp(prefix='sqlite_tests_', dir=shm_path)
+    orig_sqlite_tmpdir = os.environ.get('SQLITE_TMPDIR')
+    os.environ['SQLITE_TMPDIR'] = temp_dir
+    yield Path(temp_dir)
+    if orig_sqlite_tmpdir is None:
+        del os.environ['SQLITE_TMPDIR']
+    else:
+        os.environ['SQLITE_TMPDIR'] = orig_sqlite_tmpdir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sqlite_connect(request, monkeypatch):
+    """
+    Disable journaling and fsync for databases of ``sqlite`` tests.
+
+    Patches `sqlite3.connect` so the connection opened inside
+    `to_sqlite` skips the rollback journal and fsync, cutting the
+    write amplification of the ephemeral test databases. Applied only
+    to tests carrying the ``sqlite`` marker.
+    """
+    if request.node.get_closest_marker('sqlite') is None:
+        yield
+        return
+    import sqlite3
+    orig_connect = sqlite3.connect
+    def _connect(*args, **kwargs):
+        con = orig_connect(*args, **kwargs)
+        con.executescript(
+            "PRAGMA journal_mode = MEMORY;"
+            "PRAGMA synchronous = OFF;"
+            "PRAGMA temp_store = MEMORY;"
+            )
+        return con
+    monkeypatch.setattr(sqlite3, 'connect', _connect)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _disable_views(request, monkeypatch):
+    """
+    Set `options.views` to None for ``sqlite`` tests.
+
+    The to_sqlite tests verify table contents and do not need the
+    default views. Tests exercising `options.views` override the value
+    with their own ``monkeypatch.setattr`` call.
+    """
+    if request.node.get_closest_marker('sqlite') is None:
+        return
+    from xbrl_filings_api import options
+    monkeypatch.setattr(options, 'views', None)
+
+
+@pytest.fixture(scope='package')
+def open_test_db():
+    """
+    Connect a test database with journaling and fsync disabled.
+
+    Returns a function opening the SQLite3 database in the given path
+    and returning ``(con, cur)``. The pragmas skip rollback journal
+    and fsync setup, which dominates the sub-second verification
+    queries on the ephemeral databases written by ``to_sqlite`` tests.
+    """
+    import sqlite3
+    def _open_test_db(db_path):
+        # isolation_level=None skips the implicit BEGIN on first SELECT
+        con = sqlite3.connect(db_path, isolation_level=None)
+        cur = con.cursor()
+        cur.execute("PRAGMA journal_mode = MEMORY")
+        cur.execute("PRAGMA synchronous = OFF")
+        cur.execute("PRAGMA temp_store = MEMORY")
+        return con, cur
+    return _open_test_db
 
 
 @pytest.fixture(scope='package')
 def db_record_count():
     """Get total count of database records in Filing table."""
     def _db_record_count(cur):
-        cur.execute("SELECT COUNT(*) FROM Filing")
-        return cur.fetchone()[0]
+        return cur.execute(_COUNT_FILINGS_SQL).fetchone()[0]
     return _db_record_count
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def mock_response_data():
     """Arbitrary data for mock download, 1000 chars."""
-    return '0123456789' * 100
+    return _MOCK_RESPONSE_DATA
 
 
-@pytest.fixture(scope='module')
-def mock_response_sha256(mock_response_data):
+@pytest.fixture(scope='session')
+def mock_response_sha256():
     """SHA-256 hash for fixture mock_response_data."""
-    fhash = hashlib.sha256(
-        string=mock_response_data.encode(encoding='utf-8'),
-        usedforsecurity=False
-        )
-    return fhash.hexdigest()
+    return _MOCK_RESPONSE_SHA256
 
 
 @pytest.fixture(scope='module')
-def mock_url_response(mock_response_data):
+def mock_url_response():
     """Add a `responses` mock URL with fixt mock_response_data body."""
     def _mock_url_response(
-            url: str, rsps: Union[responses.RequestsMock, None] = None):
-        if rsps is None:
-            rsps = responses
+            url: str,
+            rsps: Union[responses.RequestsMock, ModuleType] = responses):
         rsps.add(
             method=responses.GET,
             url=url,
-            body=mock_response_data,
+            body=_MOCK_RESPONSE_DATA,
             headers={}
             )
     return _mock_url_response
 
 
-@pytest.fixture(scope='package')
-def get_oldest3_fi_filingset(urlmock):
-    """Get FilingSet from mock response oldest3_fi."""
-    def _get_oldest3_fi_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi')
+@pytest.fixture(scope='module')
+def bulk_mock_url_responses():
+    """Add `responses` mock URLs with fixt mock_response_data body."""
+    def _bulk_mock_url_responses(
+            urls,
+            rsps: Union[responses.RequestsMock, ModuleType] = responses):
+        registry = getattr(rsps, 'mock', rsps)._registry
+        registry.registered.extend(
+            responses.Response(
+                method=responses.GET, url=url, body=_MOCK_RESPONSE_DATA)
+            for url in urls
+            )
+    return _bulk_mock_url_responses
+
+
+_oldest3_fi_filingset_cache = {}
+"""FilingSet objects of ``oldest3_fi*`` mocks, keyed by mock name."""
+
+_oldest3_fi_rsps = responses.RequestsMock()
+"""Shared RequestsMock for building ``oldest3_fi*`` filing sets."""
+
+
+def _get_cached_oldest3_fi_filingset(urlmock, urlmock_name, flags):
+    """
+    Get deep copy of the FilingSet from mock `urlmock_name`.
+
+    The mocked queries are deterministic so the query pipeline is run
+    once per mock for the test run. Each call returns a deep copy of
+    the cached set so tests may freely mutate the returned set.
+    """
+    import xbrl_filings_api as xf
+    fs = _oldest3_fi_filingset_cache.get(urlmock_name)
+    if fs is None:
+        with _oldest3_fi_rsps as rsps:
+            urlmock.apply(rsps, urlmock_name)
             fs = xf.get_filings(
                 filters={'country': 'FI'},
                 sort='date_added',
                 limit=3,
-                flags=xf.GET_ONLY_FILINGS,
+                flags=flags,
                 add_api_params=None
                 )
-        return fs
+        _oldest3_fi_filingset_cache[urlmock_name] = fs
+    # Argless union() returns a deep copy of the set contents
+    return fs.union()
+
+
+@pytest.fixture(scope='package')
+def get_oldest3_fi_filingset(urlmock):
+    """Get FilingSet from mock response oldest3_fi."""
+    import xbrl_filings_api as xf
+    def _get_oldest3_fi_filingset():
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi', xf.GET_ONLY_FILINGS)
     return _get_oldest3_fi_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_entities_filingset(urlmock):
     """Get FilingSet from mock response oldest3_fi_entities."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_entities_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_entities')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=xf.GET_ENTITY,
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_entities', xf.GET_ENTITY)
     return _get_oldest3_fi_entities_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_vmessages_filingset(urlmock):
     """Get FilingSet from mock response oldest3_fi_vmessages."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_vmessages_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_vmessages')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=xf.GET_VALIDATION_MESSAGES,
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_vmessages', xf.GET_VALIDATION_MESSAGES)
     return _get_oldest3_fi_vmessages_filingset
 
 
 @pytest.fixture(scope='package')
 def get_oldest3_fi_ent_vmessages_filingset(urlmock):
     """Get FilingSet from mock response ``oldest3_fi_ent_vmessages``."""
+    import xbrl_filings_api as xf
     def _get_oldest3_fi_ent_vmessages_filingset():
-        fs = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'oldest3_fi_ent_vmessages')
-            fs = xf.get_filings(
-                filters={'country': 'FI'},
-                sort='date_added',
-                limit=3,
-                flags=(xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES),
-                add_api_params=None
-                )
-        return fs
+        return _get_cached_oldest3_fi_filingset(
+            urlmock, 'oldest3_fi_ent_vmessages',
+            xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES)
     return _get_oldest3_fi_ent_vmessages_filingset
 
 
 @pytest.fixture(scope='package')
 def dummy_api_request():
     """Dummy APIRequest object."""
+    from xbrl_filings_api.api_request import APIRequest
     return APIRequest(
         'https://filings.xbrl.org/api/filings?Dummy=Url',
         query_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=UTC)
@@ -202,3 +368,56 @@ def all_test_functions(request):
             )
         test_funcs[fname] = func
     return test_funcs
+
+
+@pytest.fixture(scope='session')
+def _session_requests_mock():
+    """
+    Session-wide started `RequestsMock` for the URL mock fixtures.
+
+    The requests library is patched once for the whole session instead
+    of patching and unpatching around every test. The URL mock fixtures
+    reset the registered responses around each test.
+    """
+    rsps = responses.RequestsMock()
+    rsps.start()
+    yield rsps
+    rsps.stop(allow_assert=False)
+    rsps.reset()
+
+
+def _make_url_mock_fixture(name, *, islax, ordered, docstring):
+    """
+    Create a URL mock response fixture for mock collection `name`.
+
+    The created fixtures are registered from table
+    ``_URL_MOCK_FIXTURES`` generated by script ``mock_upgrade.py`` to
+    the end of ``conftest.py``. Fixtures are named ``<name>_response``
+    and for lax fixtures ``<name>_lax_response``. The lax fixtures do
+    not assert that all requests are fired and are used when the test
+    function should raise (other than APIError) and not necessarily
+    initiate all of the URL requests. Ordered fixtures match the
+    responses in strict registration order which skips first-match
+    scanning for deterministic paginated mocks.
+    """
+    fixt_name = f'{name}_lax_response' if islax else f'{name}_response'
+
+    @pytest.fixture(name=fixt_name)
+    def _url_mock_response(urlmock, _session_requests_mock):
+        rsps = _session_requests_mock
+        rsps.reset()
+        if ordered:
+            rsps._set_registry(registries.OrderedRegistry)
+        urlmock.apply(rsps, name)
+        yield rsps
+        not_called = [] if islax else [
+            match for match in rsps.registered() if match.call_count == 0]
+        rsps.reset()
+        if not_called:
+            missed = [(match.method, match.url) for match in not_called]
+            msg = f'Not all requests have been executed {missed!r}'
+            raise AssertionError(msg)
+
+    _url_mock_response.__name__ = fixt_name
+    _url_mock_response.__doc__ = docstring
+    return _url_mock_response
@@ -1,32 +1,17 @@
 """Configure `pytest.downloader` subpackage."""
 
-import hashlib
+import io
 import urllib.parse
 from pathlib import PurePosixPath
 from typing import Union
 
 import pytest
+import requests
 import responses
 
 from xbrl_filings_api.downloader import DownloadSpecs
 
 
-@pytest.fixture(scope='module')
-def mock_response_data():
-    """Arbitrary data for mock download, 1000 chars."""
-    return '0123456789' * 100
-
-
-@pytest.fixture(scope='module')
-def mock_response_sha256(mock_response_data):
-    """SHA-256 hash for fixture mock_response_data."""
-    fhash = hashlib.sha256(
-        string=mock_response_data.encode(encoding='utf-8'),
-        usedforsecurity=False
-        )
-    return fhash.hexdigest()
-
-
 @pytest.fixture(scope='module')
 def mock_response_data_charcount(mock_response_data):
     """Character count for fixture mock_response_data."""
@@ -50,6 +35,61 @@ def mock_url_response(mock_response_data):
     return _mock_url_response
 
 
+@pytest.fixture
+def fake_url_response(monkeypatch, mock_response_data):
+    """
+    Patch requests transport to return mock_response_data for any URL.
+
+    Lighter than a `responses.RequestsMock` for happy-path tests which
+    only need a status 200 body: no registry matching and no
+    patch/unpatch of the adapter stack beyond one monkeypatched
+    method.
+    """
+    content = mock_response_data.encode(encoding='utf-8')
+    # Signature dictated by HTTPAdapter.send being monkeypatched.
+    def _fake_send(self, request, **kwargs):  # noqa: ARG001
+        res = requests.Response()
+        res.status_code = 200
+        res.request = request
+        res.url = request.url
+        res.raw = io.BytesIO(content)
+        return res
+    monkeypatch.setattr('requests.adapters.HTTPAdapter.send', _fake_send)
+
+
+@pytest.fixture(scope='module')
+def _module_requests_mock():
+    """Module-wide started `RequestsMock` for fixture `rsps`."""
+    rsps = responses.RequestsMock()
+    rsps.start()
+    yield rsps
+    rsps.stop(allow_assert=False)
+    rsps.reset()
+
+
+@pytest.fixture
+def rsps(request, _module_requests_mock):
+    """
+    Started `RequestsMock` reset around the test.
+
+    The requests library is patched once per module instead of
+    patching and unpatching in every test. Asserts on teardown that
+    all registered requests were fired unless the test is
+    parametrized indirectly with value ``'lax'``.
+    """
+    islax = getattr(request, 'param', None) == 'lax'
+    rsps = _module_requests_mock
+    rsps.reset()
+    yield rsps
+    not_called = [] if islax else [
+        match for match in rsps.registered() if match.call_count == 0]
+    rsps.reset()
+    if not_called:
+        missed = [(match.method, match.url) for match in not_called]
+        msg = f'Not all requests have been executed {missed!r}'
+        raise AssertionError(msg)
+
+
 @pytest.fixture
 def plain_specs():
     """Return a plain `DownloadSpecs` object."""
@@ -9,6 +9,7 @@ Tests for downloading methods are in separate test module
 #
 # SPDX-License-Identifier: MIT
 
+import copy
 import logging
 import webbrowser
 from datetime import date, datetime, timezone
@@ -19,36 +20,57 @@ import responses
 
 import xbrl_filings_api as xf
 import xbrl_filings_api.options as options
-import xbrl_filings_api.request_processor as request_processor
 
 UTC = timezone.utc
 
 
+_filing_rsps = responses.RequestsMock()
+"""Shared RequestsMock for building the cached filings."""
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _fix_entry_point_url():
+    """Pin options.entry_point_url to its default for URL tests."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr(options, 'entry_point_url', 'https://filings.xbrl.org/api')
+    yield
+    mp.undo()
+
+
+def _get_single_filing(urlmock, urlmock_name, filters, flags):
+    """Run the query of mock `urlmock_name` and return its filing."""
+    with _filing_rsps as rsps:
+        urlmock.apply(rsps, urlmock_name)
+        fs = xf.get_filings(
+            filters=filters,
+            sort=None,
+            limit=1,
+            flags=flags,
+            add_api_params=None
+            )
+    return next(iter(fs))
+
+
 @pytest.fixture(scope='module')
-def get_asml22en_filing(urlmock):
-    """ASML Holding 2022 English AFR filing."""
-    def _get_asml22en_filing():
-        filing = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'asml22en')
-            fs = xf.get_filings(
-                filters={
-                    'filing_index': (
-                        '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0')
-                    },
-                sort=None,
-                limit=1,
-                flags=xf.GET_ONLY_FILINGS,
-                add_api_params=None
-                )
-            filing = next(iter(fs))
-        return filing
-    return _get_asml22en_filing
+def asml22en_filing(urlmock) -> xf.Filing:
+    """ASML Holding 2022 English AFR filing, shared, do not mutate."""
+    return _get_single_filing(
+        urlmock, 'asml22en',
+        {'filing_index': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'},
+        xf.GET_ONLY_FILINGS
+        )
+
+
+@pytest.fixture
+def mutable_asml22en_filing(asml22en_filing) -> xf.Filing:
+    """Shallow copy of fixture asml22en_filing, safe to mutate."""
+    return copy.copy(asml22en_filing)
 
 
 @pytest.fixture
 def asml22en_entities_filing(asml22en_entities_response, res_colls):
     """ASML Holding 2022 English AFR filing."""
+    from xbrl_filings_api import request_processor
     page_gen = request_processor.generate_pages(
         filters={'filing_index': '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'},
         limit=1,
@@ -60,25 +82,18 @@ def asml22en_entities_filing(asml22en_entities_response, res_colls):
 
 
 @pytest.fixture(scope='module')
-def get_creditsuisse21en_entity_filing(urlmock):
-    """Credit Suisse 2021 English AFR filing with Entity."""
-    def _get_creditsuisse21en_entity_filing():
-        filing = None
-        with responses.RequestsMock() as rsps:
-            urlmock.apply(rsps, 'creditsuisse21en_by_id_entity')
-            fs = xf.get_filings(
-                filters={'api_id': '162'},
-                sort=None,
-                limit=1,
-                flags=xf.GET_ENTITY,
-                add_api_params=None
-                )
-            filing = next(iter(fs))
-        return filing
-    return _get_creditsuisse21en_entity_filing
+def creditsuisse21en_entity_filing(urlmock) -> xf.Filing:
+    """
+    Credit Suisse 2021 English AFR filing with Entity, shared, do not
+    mutate.
+    """
+    return _get_single_filing(
+        urlmock, 'creditsuisse21en_by_id_entity', {'api_id': '162'},
+        xf.GET_ENTITY
+        )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def entity_list(dummy_api_request):
     """Made-up entity list: companies A, B and C (id 1-3)."""
     ent_list = [
@@ -102,7 +117,7 @@ def entity_list(dummy_api_request):
     return ent_list
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def vmessage_list(dummy_api_request):
     """Made-up validation message list: codes A, B and C (id 1-3)."""
     ent_list = [
@@ -143,28 +158,39 @@ class BadBaseBrowserMock:
         pass
 
 
+@pytest.fixture
+def bbmock_factory(monkeypatch):
+    """Make a BaseBrowserMock and set it as options.browser."""
+    def _bbmock_factory(return_value):
+        bbmock = BaseBrowserMock(return_value=return_value)
+        monkeypatch.setattr(options, 'browser', bbmock)
+        return bbmock
+    return _bbmock_factory
+
+
 class TestFilingAsml22enNoEntity:
     """Test ASML 2022 filing in English as Filing object."""
 
-    def test_repr(self, get_asml22en_filing):
+    def test_repr(self, asml22en_filing):
         """Test Filing.__repr__ method for `asml22en`."""
         e_repr = (
             "Filing(api_id='4261', "
             "filing_index='724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0')"
             )
-        filing: xf.Filing = get_asml22en_filing()
+        filing: xf.Filing = asml22en_filing
         assert repr(filing) == e_repr
 
-    def test_str(self, get_asml22en_filing):
+    def test_str(self, asml22en_filing):
         """Test Filing.__str__ method for `asml22en`."""
         e_str = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0 2022 [en]'
-        filing: xf.Filing = get_asml22en_filing()
+        filing: xf.Filing = asml22en_filing
         assert str(filing) == e_str
 
     URL_PREFIX = (
         'https://filings.xbrl.org/724500Y6DUVHQD6OXN27/2022-12-31/ESEF/NL/0')
 
     @pytest.mark.parametrize(('attr_name', 'expected'), [
+        # URL data attributes
         ('json_url', f'{URL_PREFIX}/asml-2022-12-31-en.json'),
         ('package_url', f'{URL_PREFIX}/asml-2022-12-31-en.zip'),
         (
@@ -175,36 +201,24 @@ class TestFilingAsml22enNoEntity:
             'xhtml_url',
             f'{URL_PREFIX}/asml-2022-12-31-en/reports/asml-2022-12-31-en.xhtml'
         ),
-        ])
-    def test_url_data_attributes(
-            self, get_asml22en_filing, attr_name, expected, monkeypatch):
-        """Test URL data attributes for `asml22en`."""
-        monkeypatch.setattr(
-            options, 'entry_point_url', 'https://filings.xbrl.org/api')
-        filing: xf.Filing = get_asml22en_filing()
-        assert getattr(filing, attr_name) == expected
-
-    @pytest.mark.date
-    def test_date_data_attributes(self, get_asml22en_filing):
-        """Test date data attributes (last_end_date) for `asml22en`."""
-        filing: xf.Filing = get_asml22en_filing()
-        assert filing.last_end_date == date(2022, 12, 31)
-
-    @pytest.mark.datetime
-    @pytest.mark.parametrize(('attr_name', 'expected'), [
-        ('added_time', datetime(2023, 2, 16, 14, 33, 58, 236220, tzinfo=UTC)),
-        ('added_time_str', '2023-02-16 14:33:58.236220'),
-        ('processed_time', (
-            datetime(2023, 4, 19, 10, 20, 23, 668110, tzinfo=UTC))),
-        ('processed_time_str', '2023-04-19 10:20:23.668110'),
-        ])
-    def test_datetime_data_attributes(
-            self, attr_name, expected, get_asml22en_filing):
-        """Test datetime data attributes for `asml22en`."""
-        filing: xf.Filing = get_asml22en_filing()
-        assert getattr(filing, attr_name) == expected
-
-    @pytest.mark.parametrize(('attr_name', 'expected'), [
+        # Date and datetime data attributes
+        pytest.param(
+            'last_end_date', date(2022, 12, 31), marks=pytest.mark.date),
+        pytest.param(
+            'added_time',
+            datetime(2023, 2, 16, 14, 33, 58, 236220, tzinfo=UTC),
+            marks=pytest.mark.datetime),
+        pytest.param(
+            'added_time_str', '2023-02-16 14:33:58.236220',
+            marks=pytest.mark.datetime),
+        pytest.param(
+            'processed_time',
+            datetime(2023, 4, 19, 10, 20, 23, 668110, tzinfo=UTC),
+            marks=pytest.mark.datetime),
+        pytest.param(
+            'processed_time_str', '2023-04-19 10:20:23.668110',
+            marks=pytest.mark.datetime),
+        # Other data attributes
         ('api_id', '4261'),
         ('country', 'NL'),
         ('filing_index', '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'),
@@ -218,32 +232,21 @@ class TestFilingAsml22enNoEntity:
         ('package_sha256', (
             '3f44981c656dc2bcd0ed3a88e6d062e6'
             'b8c041a656f420257bccd63535c2b6ac')),
-        ])
-    def test_other_data_attributes(
-            self, get_asml22en_filing, attr_name, expected):
-        """
-        Test data attributes which are not URLs, derived or datetimes
-        for `asml22en`.
-        """
-        filing: xf.Filing = get_asml22en_filing()
-        assert getattr(filing, attr_name) == expected
-
-    @pytest.mark.parametrize(('attr_name', 'expected'), [
+        # Derived attributes
         ('language', 'en'),
         pytest.param(
             'reporting_date', date(2022, 12, 31), marks=pytest.mark.date),
         ])
-    def test_derived_attributes(
-            self, get_asml22en_filing, attr_name, expected):
-        """Test derived data attributes for `asml22en`."""
-        filing: xf.Filing = get_asml22en_filing()
+    def test_data_attributes(self, asml22en_filing, attr_name, expected):
+        """Test data and derived attributes for `asml22en`."""
+        filing: xf.Filing = asml22en_filing
         assert getattr(filing, attr_name) == expected
 
-    def test_other_attributes(self, get_asml22en_filing):
+    def test_other_attributes(self, asml22en_filing):
         """
         Test the meta and object reference attributes for `asml22en`.
         """
-        filing: xf.Filing = get_asml22en_filing()
+        filing: xf.Filing = asml22en_filing
         assert filing.entity is None
         assert filing.validation_messages is None
         assert isinstance(filing.query_time, datetime)
@@ -292,68 +295,52 @@ class TestFilingCreditsuisse21enWithEntity:
     entity.
     """
 
-    def test_repr(self, get_creditsuisse21en_entity_filing):
+    def test_repr(self, creditsuisse21en_entity_filing):
         """Test Filing.__repr__ method for `creditsuisse21en_entity`."""
         e_repr = (
             "Filing(api_id='162', entity.name='CREDIT SUISSE INTERNATIONAL', "
             "reporting_date=date(2021, 12, 31), language=None)"
             )
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
+        filing: xf.Filing = creditsuisse21en_entity_filing
         assert repr(filing) == e_repr
 
-    def test_str(self, get_creditsuisse21en_entity_filing):
+    def test_str(self, creditsuisse21en_entity_filing):
         """Test Filing.__str__ method for `creditsuisse21en_entity`."""
         e_str = 'CREDIT SUISSE INTERNATIONAL 2021'
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
+        filing: xf.Filing = creditsuisse21en_entity_filing
         assert str(filing) == e_str
 
     @pytest.mark.parametrize(('attr_name', 'expected'), [
+        # URL data attributes
         ('json_url', None),
         ('package_url', (
             'https://filings.xbrl.org/E58DKGMJYYYJLN8C3868/2021-12-31/ESEF/LU'
             '/0/E58DKGMJYYYJLN8C3868-2021-12-31.zip')),
         ('viewer_url', None),
         ('xhtml_url', None),
+        # Datetime data attributes
+        pytest.param(
+            'processed_time',
+            datetime(2023, 1, 18, 11, 2, 9, 42110, tzinfo=UTC),
+            marks=pytest.mark.datetime),
+        pytest.param(
+            'processed_time_str', '2023-01-18 11:02:09.042110',
+            marks=pytest.mark.datetime),
+        # Other data attributes
+        ('entity_api_id', '123'),
         ])
-    def test_url_data_attributes(
-            self, get_creditsuisse21en_entity_filing, attr_name, expected,
-            monkeypatch):
-        """
-        Test URL data attributes for `creditsuisse21en_entity`.
-        """
-        monkeypatch.setattr(
-            options, 'entry_point_url', 'https://filings.xbrl.org/api')
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
-        assert getattr(filing, attr_name) == expected
-
-    @pytest.mark.datetime
-    @pytest.mark.parametrize(('attr_name', 'expected'), [
-        ('processed_time', datetime(2023, 1, 18, 11, 2, 9, 42110, tzinfo=UTC)),
-        ('processed_time_str', '2023-01-18 11:02:09.042110'),
-        ])
-    def test_datetime_data_attributes(
-            self, get_creditsuisse21en_entity_filing, attr_name, expected):
-        """
-        Test datetime data attributes for `creditsuisse21en_entity`.
-        """
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
+    def test_data_attributes(
+            self, creditsuisse21en_entity_filing, attr_name, expected):
+        """Test data attributes for `creditsuisse21en_entity`."""
+        filing: xf.Filing = creditsuisse21en_entity_filing
         assert getattr(filing, attr_name) == expected
 
-    def test_data_attribute_entity_api_id(
-            self, get_creditsuisse21en_entity_filing):
-        """
-        Test data attribute `entity_api_id` for
-        `creditsuisse21en_entity`.
-        """
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
-        assert filing.entity_api_id == '123'
-
-    def test_other_attributes(self, get_creditsuisse21en_entity_filing):
+    def test_other_attributes(self, creditsuisse21en_entity_filing):
         """
         Test the meta and object reference attributes for
         `creditsuisse21en_entity`.
         """
-        filing: xf.Filing = get_creditsuisse21en_entity_filing()
+        filing: xf.Filing = creditsuisse21en_entity_filing
         assert isinstance(filing.entity, xf.Entity)
         assert filing.validation_messages is None
 
@@ -368,9 +355,9 @@ class TestFilingCreditsuisse21enWithEntity:
     (date(2022, 1, 31), 'Jan-2022'),
     ])
 def test_get_simple_filing_date(
-        date_obj, expected, get_asml22en_filing):
+        date_obj, expected, asml22en_filing):
     """Test method `_get_simple_filing_date` used by `__str__`."""
-    filing: xf.Filing = get_asml22en_filing()
+    filing: xf.Filing = asml22en_filing
     assert filing._get_simple_filing_date(date_obj) == expected
 
 
@@ -379,9 +366,9 @@ def test_get_simple_filing_date(
     ('3', 'Company C'),
     ])
 def test_search_entity_success(
-        api_id, expected_name, get_asml22en_filing, entity_list):
+        api_id, expected_name, mutable_asml22en_filing, entity_list):
     """Test method `_search_entity` used by `entity`."""
-    filing: xf.Filing = get_asml22en_filing()
+    filing: xf.Filing = mutable_asml22en_filing
     filing.entity_api_id = api_id
     found_entity = filing._search_entity(entity_list, {})
     assert isinstance(found_entity, xf.Entity)
@@ -394,7 +381,7 @@ def test_search_entity_success(
     '4',
     ])
 def test_search_entity_fail(
-        api_id, caplog, get_asml22en_filing, entity_list):
+        api_id, caplog, mutable_asml22en_filing, entity_list):
     """
     Test method `test_search_entity_fail` used by `entity` for failures.
     """
@@ -409,7 +396,7 @@ def test_search_entity_fail(
         "Entity with api_id='{}' not found, referenced by " + e_filing_repr
         )
     caplog.set_level(logging.WARNING)
-    filing: xf.Filing = get_asml22en_filing()
+    filing: xf.Filing = mutable_asml22en_filing
     filing.entity_api_id = api_id
 
     found_entity = filing._search_entity(entity_list, {})
@@ -421,34 +408,26 @@ def test_search_entity_fail(
     assert found_entity is None
 
 
-def test_search_validation_messages_success(
-        monkeypatch, get_asml22en_filing, vmessage_list):
-    """
-    Test method `_search_validation_messages` used by
-    `validation_messages`.
-    """
-    filing: xf.Filing = get_asml22en_filing()
-
-    def patch_json_get(key_path: Any = '', parse_type: Any = None):
+def _make_json_get(msg_ids):
+    """Make a patch of `filing._json.get` returning vmessage ids."""
+    def _patch_json_get(key_path: Any = '', parse_type: Any = None):
         return [
-            {'type': 'validation_message', 'id': '1'},
-            {'type': 'validation_message', 'id': '3'},
+            {'type': 'validation_message', 'id': msg_id}
+            for msg_id in msg_ids
             ]
-    monkeypatch.setattr(filing._json, 'get', patch_json_get, raising=True)
-
-    found_vmessages = filing._search_validation_messages(vmessage_list, {})
-
-    assert isinstance(found_vmessages, set)
-    assert len(found_vmessages) == 2
-    for vmsg in found_vmessages:
-        assert isinstance(vmsg, xf.ValidationMessage)
+    return _patch_json_get
 
 
-def test_search_validation_messages_fail(
-        caplog, monkeypatch, get_asml22en_filing, vmessage_list):
+@pytest.mark.parametrize(('msg_ids', 'e_found_ids', 'e_notfound_ids'), [
+    (('1', '3'), {'1', '3'}, ()),
+    (('0', '4'), set(), ('0', '4')),
+    ])
+def test_search_validation_messages(
+        msg_ids, e_found_ids, e_notfound_ids, caplog, monkeypatch,
+        asml22en_filing, vmessage_list):
     """
     Test method `_search_validation_messages` used by
-    `validation_messages` for failures.
+    `validation_messages` for found and not found messages.
     """
     e_log = (
         "Validation message with api_id='{}' not found, referenced by "
@@ -456,20 +435,18 @@ def test_search_validation_messages_fail(
         "filing_index='724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0')"
         )
     caplog.set_level(logging.WARNING)
-    filing: xf.Filing = get_asml22en_filing()
-
-    def patch_json_get(key_path: Any = '', parse_type: Any = None):
-        return [
-            {'type': 'validation_message', 'id': '0'},
-            {'type': 'validation_message', 'id': '4'},
-            ]
-    monkeypatch.setattr(filing._json, 'get', patch_json_get, raising=True)
+    filing: xf.Filing = asml22en_filing
+    monkeypatch.setattr(
+        filing._json, 'get', _make_json_get(msg_ids), raising=True)
 
     found_vmessages = filing._search_validation_messages(vmessage_list, {})
 
-    for aid in ('0', '4'):
-        assert e_log.format(aid) in caplog.text
-    assert found_vmessages == set()
+    assert isinstance(found_vmessages, set)
+    assert {vmsg.api_id for vmsg in found_vmessages} == e_found_ids
+    for vmsg in found_vmessages:
+        assert isinstance(vmsg, xf.ValidationMessage)
+    for msg_id in e_notfound_ids:
+        assert e_log.format(msg_id) in caplog.text
 
 
 URL_START = (
@@ -483,16 +460,22 @@ URL_START = (
     ((URL_START + 'asml-2022-12-31-en'), 'asml-2022-12-31-en'),
     ((URL_START + 'asml/2022-12-31-en'), '2022-12-31-en'),
     ((URL_START + 'asml/'), 'asml'),
+    # Bad URL
+    ('https://[1:2:3:4:5:6/stem', None),
+    # Empty path
+    ('https://filing.xbrl.org', None),
+    # Stem as a space character
+    ('https://filing.xbrl.org/path/%20/', None),
     ])
-def test_get_url_stem(url, expected, get_asml22en_filing):
+def test_get_url_stem(url, expected):
     """
     Test method `_get_url_stem` used by `language` and `reporting_date`.
     """
-    filing: xf.Filing = get_asml22en_filing()
+    # The method does not depend on instance state, call unbound
     if expected is None:
-        assert filing._get_url_stem(url) is None
+        assert xf.Filing._get_url_stem(None, url) is None
     else:
-        assert filing._get_url_stem(url) == expected
+        assert xf.Filing._get_url_stem(None, url) == expected
 
 
 def test_language_from_xhtml_url(
@@ -516,45 +499,43 @@ LANGUAGE_URL_PREFIX = (
     'https://filings.xbrl.org/743700KMZL7E8PLI5X73/2021-12-31/ESEF/FI/0')
 
 
-@pytest.mark.parametrize(('country', 'orig_language', 'e_language'), [
-    ('CZ', 'cz', 'cs'),
-    ('SE', 'se', 'sv'),
-    ('DK', 'dk', 'da'),
-    ('NO', 'nb', 'no'),
-    ('NO', 'nn', 'no'),
-    ])
-def test_derive_language_correct_common_mistakes(
-        country, orig_language, e_language, asml22en_entities_filing):
+@pytest.mark.parametrize(
+    ('country', 'package_url_tail', 'method_name', 'expected'), [
+        # _correct_common_language_code_mistakes via _derive_language
+        ('CZ', '743700KMZL7E8PLI5X73-2020-12-31-cz.zip',
+            '_derive_language', 'cs'),
+        ('SE', '743700KMZL7E8PLI5X73-2020-12-31-se.zip',
+            '_derive_language', 'sv'),
+        ('DK', '743700KMZL7E8PLI5X73-2020-12-31-dk.zip',
+            '_derive_language', 'da'),
+        ('NO', '743700KMZL7E8PLI5X73-2020-12-31-nb.zip',
+            '_derive_language', 'no'),
+        ('NO', '743700KMZL7E8PLI5X73-2020-12-31-nn.zip',
+            '_derive_language', 'no'),
+        # 3 letter language
+        (None, '743700KMZL7E8PLI5X73-2020-12-31_fin.zip',
+            '_derive_language', 'fi'),
+        # Bad 3-letter language 'XYZ'
+        (None, '743700KMZL7E8PLI5X73-2020-12-31_XYZ.zip',
+            '_derive_language', None),
+        # Nonexistent date '2020-02-31'
+        (None, '743700KMZL7E8PLI5X73-2020-02-31_fin.zip',
+            '_derive_reporting_date', None),
+        ])
+def test_derive_from_package_url(
+        country, package_url_tail, method_name, expected,
+        asml22en_entities_filing):
     """
-    Test _correct_common_language_code_mistakes with via
-    _derive_language.
+    Test methods `_derive_language` and `_derive_reporting_date` on
+    varying `package_url` values.
     """
     filing: xf.Filing = asml22en_entities_filing
-    filing.country = country
-    filing.package_url = (
-        f'{LANGUAGE_URL_PREFIX}/743700KMZL7E8PLI5X73-2020-12-31-'
-        f'{orig_language}.zip'
-        )
+    if country:
+        filing.country = country
+    filing.package_url = f'{LANGUAGE_URL_PREFIX}/{package_url_tail}'
     filing.xhtml_url = None # Disable fallback
-    assert filing._derive_language() == e_language
-
-
-def test_derive_language_3letters(asml22en_entities_filing):
-    """Test _derive_language with 3 letter language."""
-    filing: xf.Filing = asml22en_entities_filing
-    filing.package_url = (
-        f'{LANGUAGE_URL_PREFIX}/743700KMZL7E8PLI5X73-2020-12-31_fin.zip')
-    filing.xhtml_url = None # Disable fallback
-    assert filing._derive_language() == 'fi'
-
-
-def test_derive_language_bad_3letter_language(asml22en_entities_filing):
-    """Test _derive_language with a bad 3-letter language 'XYZ'."""
-    filing: xf.Filing = asml22en_entities_filing
-    filing.package_url = (
-        f'{LANGUAGE_URL_PREFIX}/743700KMZL7E8PLI5X73-2020-12-31_XYZ.zip')
-    filing.xhtml_url = None # Disable fallback
-    assert filing._derive_language() is None
+    filing.last_end_date = None # Disable fallback when could not derive
+    assert getattr(filing, method_name)() == expected
 
 
 def test_str_no_entity_name(asml22en_entities_filing):
@@ -571,73 +552,28 @@ def test_str_no_reporting_date(asml22en_entities_filing):
     assert str(asml22en_entities_filing) == e_str
 
 
-def test_derive_reporting_date_bad_date(asml22en_entities_filing):
-    """
-    Test _derive_reporting_date with a nonexistent date '2020-02-31'.
-    """
-    filing: xf.Filing = asml22en_entities_filing
-    filing.package_url = (
-        'https://filings.xbrl.org/743700KMZL7E8PLI5X73/2021-12-31/ESEF'
-        '/FI/0/743700KMZL7E8PLI5X73-2020-02-31_fin.zip'
-        )
-    filing.last_end_date = None # Disable fallback when could not derive
-    assert filing._derive_reporting_date() is None
-
-
-def test_get_url_stem_bad_url():
-    """Test _get_url_stem with a bad URL."""
-    bad_url = 'https://[1:2:3:4:5:6/stem'
-    assert xf.Filing._get_url_stem(None, bad_url) is None
-
-
-def test_get_url_stem_empty_path():
-    """Test _get_url_stem with a an empty path."""
-    emptypath_url = 'https://filing.xbrl.org'
-    assert xf.Filing._get_url_stem(None, emptypath_url) is None
-
-
-def test_get_url_stem_space_chr_value():
-    """Test _get_url_stem with stem as a space character."""
-    emptypath_url = 'https://filing.xbrl.org/path/%20/'
-    assert xf.Filing._get_url_stem(None, emptypath_url) is None
-
-
-def test_open_arguments_open_viewer_true(get_asml22en_filing, monkeypatch):
-    """
-    Test `Filing.open` calls `BaseBrowser.open` with correct arguments,
-    options.open_viewer=True.
-    """
-    monkeypatch.setattr(options, 'open_viewer', True)
-    bbmock = BaseBrowserMock(return_value=True)
-    monkeypatch.setattr(options, 'browser', bbmock)
-    filing: xf.Filing = get_asml22en_filing()
-    call_return = filing.open(
-        new=0,
-        autoraise=True
-        )
-    assert bbmock.call_kwargs['url'] == filing.viewer_url
-    assert bbmock.call_kwargs['new'] == 0
-    assert bbmock.call_kwargs['autoraise'] is True
-    assert call_return is True
-
-
-def test_open_arguments_open_viewer_false(get_asml22en_filing, monkeypatch):
+@pytest.mark.parametrize(
+    ('open_viewer', 'attr_name', 'new', 'autoraise', 'return_value'), [
+        (True, 'viewer_url', 0, True, True),
+        (False, 'xhtml_url', 2, False, False),
+        ])
+def test_open_arguments(
+        open_viewer, attr_name, new, autoraise, return_value,
+        asml22en_filing, bbmock_factory, monkeypatch):
     """
-    Test `Filing.open` calls `BaseBrowser.open` with correct arguments,
-    options.open_viewer=False.
+    Test `Filing.open` calls `BaseBrowser.open` with correct arguments.
     """
-    monkeypatch.setattr(options, 'open_viewer', False)
-    bbmock = BaseBrowserMock(return_value=False)
-    monkeypatch.setattr(options, 'browser', bbmock)
-    filing: xf.Filing = get_asml22en_filing()
+    monkeypatch.setattr(options, 'open_viewer', open_viewer)
+    bbmock = bbmock_factory(return_value)
+    filing: xf.Filing = asml22en_filing
     call_return = filing.open(
-        new=2,
-        autoraise=False
+        new=new,
+        autoraise=autoraise
         )
-    assert bbmock.call_kwargs['url'] == filing.xhtml_url
-    assert bbmock.call_kwargs['new'] == 2
-    assert bbmock.call_kwargs['autoraise'] is False
-    assert call_return is False
+    assert bbmock.call_kwargs['url'] == getattr(filing, attr_name)
+    assert bbmock.call_kwargs['new'] == new
+    assert bbmock.call_kwargs['autoraise'] is autoraise
+    assert call_return is return_value
 
 
 @pytest.mark.parametrize(('open_viewer', 'attr_name'), [
@@ -645,12 +581,12 @@ def test_open_arguments_open_viewer_false(get_asml22en_filing, monkeypatch):
     (False, 'xhtml_url'),
     ])
 def test_open_none_url(
-        open_viewer, attr_name, get_asml22en_filing, monkeypatch):
+        open_viewer, attr_name, mutable_asml22en_filing, bbmock_factory,
+        monkeypatch):
     """Test `Filing.open` when open URL attribute is None."""
     monkeypatch.setattr(options, 'open_viewer', open_viewer)
-    bbmock = BaseBrowserMock(return_value=True)
-    monkeypatch.setattr(options, 'browser', bbmock)
-    filing: xf.Filing = get_asml22en_filing()
+    bbmock_factory(True)
+    filing: xf.Filing = mutable_asml22en_filing
     setattr(filing, attr_name, None)
     with pytest.raises(
             ValueError, match=rf'The attribute "{attr_name}" value is None.'):
@@ -661,14 +597,14 @@ def test_open_none_url(
 
 
 def test_open_options_browser_none_bad_browser(
-        get_asml22en_filing, monkeypatch):
+        asml22en_filing, monkeypatch):
     """
     Test `Filing.open` when options.browser is not BaseBrowser-like.
     """
     monkeypatch.setattr(options, 'open_viewer', True)
     bad_bbmock = BadBaseBrowserMock()
     monkeypatch.setattr(options, 'browser', bad_bbmock)
-    filing: xf.Filing = get_asml22en_filing()
+    filing: xf.Filing = asml22en_filing
     with pytest.raises(
             TypeError,
             match=r'Value options.browser is not webbrowser.BaseBrowser.'):
@@ -679,7 +615,7 @@ def test_open_options_browser_none_bad_browser(
 
 
 def test_open_options_browser_none_webbrowser_get(
-        get_asml22en_filing, monkeypatch):
+        asml22en_filing, monkeypatch):
     """
     Test `Filing.open` calls `webbrowser.get` when options.browser is
     None.
@@ -688,7 +624,7 @@ def test_open_options_browser_none_webbrowser_get(
     monkeypatch.setattr(options, 'browser', None)
     monkeypatch.setattr(
         webbrowser, 'get', lambda: BaseBrowserMock(return_value=True))
-    filing: xf.Filing = get_asml22en_filing()
+    filing: xf.Filing = asml22en_filing
     ret_value = filing.open(
         new=0,
         autoraise=True
@@ -97,9 +97,8 @@ def test_columns_attribute(get_oldest3_fi_filingset):
 
 @pytest.mark.sqlite
 def test_to_sqlite(
-        get_oldest3_fi_filingset, db_record_count, tmp_path, monkeypatch):
+        get_oldest3_fi_filingset, db_record_count, tmp_path):
     """Test method `to_sqlite`."""
-    monkeypatch.setattr(xf.options, 'views', None)
     e_fxo_ids = {
         '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0',
         '549300UWB1AIR85BM957-2020-12-31-ESEF-FI-0',
@@ -116,7 +115,7 @@ def test_to_sqlite(
     con = sqlite3.connect(db_path)
     cur = con.cursor()
     cur.execute("SELECT filing_index FROM Filing")
-    saved_fxo_ids = {row[0] for row in cur.fetchall()}
+    saved_fxo_ids = {row[0] for row in cur}
     assert saved_fxo_ids == e_fxo_ids
     assert db_record_count(cur) == 3
     con.close()
@@ -125,12 +124,11 @@ def test_to_sqlite(
 @pytest.mark.sqlite
 def test_to_sqlite_update_same_add_entities(
         get_oldest3_fi_filingset, get_oldest3_fi_entities_filingset,
-        db_record_count, tmp_path, monkeypatch):
+        db_record_count, tmp_path):
     """
     Test method `to_sqlite` with update=True updating same records,
     adding Entity.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     e_fxo_ids = {
         '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0',
         '549300UWB1AIR85BM957-2020-12-31-ESEF-FI-0',
@@ -188,12 +186,11 @@ def test_to_sqlite_update_same_add_entities(
 @pytest.mark.sqlite
 def test_to_sqlite_update_same_add_vmessages(
         get_oldest3_fi_filingset, get_oldest3_fi_vmessages_filingset,
-        db_record_count, tmp_path, monkeypatch):
+        db_record_count, tmp_path):
     """
     Test method `to_sqlite` with update=True updating same records,
     adding ValidationMessage.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     e_fxo_ids = {
         '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0',
         '549300UWB1AIR85BM957-2020-12-31-ESEF-FI-0',
@@ -249,9 +246,8 @@ def test_to_sqlite_update_same_add_vmessages(
 @pytest.mark.sqlite
 def test_to_sqlite_update_more(
         get_oldest3_fi_filingset, asml22en_filingset, db_record_count,
-        tmp_path, monkeypatch):
+        tmp_path):
     """Test method `to_sqlite` with update=True adding more records."""
-    monkeypatch.setattr(xf.options, 'views', None)
     e_before_fxo_ids = {
         '743700EPLUWXE25HGM03-2020-12-31-ESEF-FI-0',
         '549300UWB1AIR85BM957-2020-12-31-ESEF-FI-0',
@@ -299,12 +295,11 @@ def test_to_sqlite_update_more(
 
 @pytest.mark.sqlite
 def test_to_sqlite_update_more_but_false(
-        get_oldest3_fi_filingset, asml22en_filingset, tmp_path, monkeypatch):
+        get_oldest3_fi_filingset, asml22en_filingset, tmp_path):
     """
     Test method `to_sqlite` trying to update existing database but
     update=False.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     db_path = tmp_path / 'test_to_sqlite_update_more_but_false.db'
 
     fs_a: xf.FilingSet = get_oldest3_fi_filingset()
@@ -332,12 +327,11 @@ def test_to_sqlite_update_more_but_false(
 
 @pytest.mark.sqlite
 def test_to_sqlite_update_no_tables(
-    asml22en_filingset, tmp_path, monkeypatch):
+    asml22en_filingset, tmp_path):
     """
     Test method `to_sqlite` trying to update database without expected
     tables.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     db_path = tmp_path / 'test_to_sqlite_update_no_tables.db'
 
     con = sqlite3.connect(db_path)
@@ -375,12 +369,11 @@ def test_to_sqlite_update_no_tables(
 
 @pytest.mark.sqlite
 def test_to_sqlite_update_no_api_id(
-    asml22en_filingset, tmp_path, monkeypatch):
+    asml22en_filingset, tmp_path):
     """
     Test method `to_sqlite` trying to update database whose table has
     no api_id.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     db_path = tmp_path / 'test_to_sqlite_update_no_api_id.db'
 
     con = sqlite3.connect(db_path)
@@ -421,9 +414,8 @@ def test_to_sqlite_update_no_api_id(
 
 @pytest.mark.sqlite
 def test_to_sqlite_path_reserved(
-        get_oldest3_fi_filingset, tmp_path, monkeypatch):
+        get_oldest3_fi_filingset, tmp_path):
     """Test method `to_sqlite` but assigned path is a folder."""
-    monkeypatch.setattr(xf.options, 'views', None)
     reserved_path = tmp_path / 'test_to_sqlite_path_reserved'
     reserved_path.mkdir()
 
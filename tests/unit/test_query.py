@@ -7,8 +7,9 @@
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
-import sqlite3
 from datetime import timezone
+from itertools import islice
+from uuid import uuid4
 
 import pytest
 import responses
@@ -18,13 +19,14 @@ import xbrl_filings_api as xf
 
 UTC = timezone.utc
 
+ASML22_FXO = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
+
 
 def test_get_filings(asml22en_response):
     """Requested filing is returned."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
     fs = xf.get_filings(
         filters={
-            'filing_index': asml22_fxo
+            'filing_index': ASML22_FXO
             },
         sort=None,
         limit=1,
@@ -35,27 +37,25 @@ def test_get_filings(asml22en_response):
 
 
 @pytest.mark.sqlite
-def test_to_sqlite(asml22en_response, db_record_count, tmp_path, monkeypatch):
+def test_to_sqlite(
+        asml22en_response, db_record_count, open_test_db, sqlite_tmp_dir):
     """Requested filing is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    db_path = tmp_path / 'test_to_sqlite.db'
+    db_path = sqlite_tmp_dir / f'test_to_sqlite_{uuid4().hex[:8]}.db'
     xf.to_sqlite(
         path=db_path,
         update=False,
         filters={
-            'filing_index': asml22_fxo
+            'filing_index': ASML22_FXO
             },
         sort=None,
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
+    con, cur = open_test_db(db_path)
     cur.execute(
         "SELECT COUNT(*) FROM Filing WHERE filing_index = ?",
-        (asml22_fxo,)
+        (ASML22_FXO,)
         )
     assert cur.fetchone() == (1,), 'Fetched record ends up in the database'
     assert db_record_count(cur) == 1
@@ -65,18 +65,18 @@ def test_to_sqlite(asml22en_response, db_record_count, tmp_path, monkeypatch):
 @pytest.mark.paging
 def test_filing_page_iter(asml22en_response):
     """Requested filing is returned on a filing page."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
     piter = xf.filing_page_iter(
         filters={
-            'filing_index': asml22_fxo
+            'filing_index': ASML22_FXO
             },
         sort=None,
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
-    page = next(piter, None)
-    assert isinstance(page, xf.FilingsPage), 'First iteration returns a page'
-    asml22 = next(iter(page.filing_list), None)
+    pages = list(islice(piter, 2))
+    assert len(pages) == 1, 'Single page of results'
+    assert isinstance(pages[0], xf.FilingsPage), 'Iteration returns pages'
+    asml22 = next(iter(pages[0].filing_list), None)
     assert isinstance(asml22, xf.Filing), 'Filing is returned on a page'
 
 
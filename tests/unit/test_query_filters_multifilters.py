@@ -7,8 +7,8 @@
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
-import sqlite3
 from datetime import datetime, timezone
+from uuid import uuid4
 
 import pytest
 
@@ -18,153 +18,130 @@ UTC = timezone.utc
 
 pytestmark = pytest.mark.multifilter
 
-
-def test_get_filings_api_id(multifilter_api_id_response):
-    """Requested `api_id` filings are returned."""
-    shell_api_ids = '1134', '1135', '4496', '4529'
-    fs = xf.get_filings(
-        filters={
-            'api_id': shell_api_ids
+SHELL_API_IDS = '1134', '1135', '4496', '4529'
+COUNTRY_CODES = ('FI', 'SE', 'NO')
+FILING_INDEX_CODES = (
+    '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
+    '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
+    )
+CLOETTA_SV_STRS = (
+    '2023-01-18 11:02:06.724768',
+    '2023-05-16 21:07:17.825836'
+    )
+CLOETTA_SV_OBJS = (
+    datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
+    datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
+    )
+CLOETTA_SV_NAIVE_OBJS = (
+    datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=None),
+    datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=None)
+    )
+
+MULTIFILTER_CASES = [
+    pytest.param(
+        'multifilter_api_id_response',
+        {'api_id': SHELL_API_IDS},
+        4,
+        {'api_id': frozenset(SHELL_API_IDS)},
+        'api_id',
+        frozenset(SHELL_API_IDS),
+        id='api_id'
+        ),
+    pytest.param(
+        'multifilter_country_response',
+        {'country': COUNTRY_CODES},
+        3,
+        # Only FI available, match count
+        {'country': frozenset({'FI'})},
+        'country',
+        frozenset({'FI'}),
+        id='country_only_first'
+        ),
+    pytest.param(
+        'multifilter_filing_index_response',
+        {'filing_index': FILING_INDEX_CODES},
+        2,
+        {'filing_index': frozenset(FILING_INDEX_CODES)},
+        'filing_index',
+        frozenset(FILING_INDEX_CODES),
+        id='filing_index'
+        ),
+    pytest.param(
+        'multifilter_processed_time_response',
+        {'processed_time': CLOETTA_SV_STRS},
+        2,
+        {
+            'processed_time_str': frozenset(CLOETTA_SV_STRS),
+            'processed_time': frozenset(CLOETTA_SV_OBJS)
             },
-        sort=None,
-        limit=4,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    received_api_ids = {filing.api_id for filing in fs}
-    assert received_api_ids == set(shell_api_ids)
-
-
-@pytest.mark.sqlite
-def test_to_sqlite_api_id(
-        multifilter_api_id_response, db_record_count, tmp_path, monkeypatch):
-    """Filtering by `api_id` inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    shell_api_ids = '1134', '1135', '4496', '4529'
-    db_path = tmp_path / 'test_to_sqlite_api_id.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'api_id': shell_api_ids
-            },
-        sort=None,
-        limit=4,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT api_id FROM Filing "
-        "WHERE api_id IN (?, ?, ?, ?)",
-        shell_api_ids
-        )
-    saved_ids = {row[0] for row in cur.fetchall()}
-    assert saved_ids == set(shell_api_ids)
-    assert db_record_count(cur) == 4
-    con.close()
-
-
-def test_get_filings_country_only_first(multifilter_country_response):
-    """Requested `country` filings are returned."""
-    country_codes = ['FI', 'SE', 'NO']
-    fs = xf.get_filings(
-        filters={
-            'country': country_codes
-            },
-        sort=None,
-        limit=3,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert len(fs) == 3, 'Requested number of filings returned'
-    received_countries = {filing.country for filing in fs}
-    assert 'FI' in received_countries, 'Only FI available, match count'
-    assert 'SE' not in received_countries, 'Too many FI filings'
-    assert 'NO' not in received_countries, 'Too many FI filings'
-
-
-@pytest.mark.sqlite
-def test_to_sqlite_country_only_first(
-        multifilter_country_response, db_record_count, tmp_path, monkeypatch):
-    """Filtering by `country` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    country_codes = ['FI', 'SE', 'NO']
-    db_path = tmp_path / 'test_to_sqlite_country_only_first.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'country': country_codes
-            },
-        sort=None,
-        limit=3,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT country FROM Filing "
-        "WHERE country IN (?, ?, ?)",
-        country_codes
-        )
-    saved_countries = {row[0] for row in cur.fetchall()}
-    assert saved_countries == {'FI'}
-    assert db_record_count(cur) == 3
-    con.close()
-
-
-def test_get_filings_filing_index(
-        multifilter_filing_index_response):
-    """Requested `filing_index` filings are returned."""
-    filing_index_codes = (
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
-        )
+        'processed_time',
+        frozenset(CLOETTA_SV_STRS),
+        marks=pytest.mark.datetime,
+        id='processed_time_str'
+        ),
+    ]
+"""Columns: fixture_name, filters, limit, e_attr_sets, db_field,
+e_db_set."""
+
+
+def _fetch_column_and_count(cur, col):
+    """Fetch set of Filing column `col` values and table row count."""
+    cur.execute(f"SELECT {col} FROM Filing")  # noqa: S608
+    values = set()
+    count = 0
+    for row in cur:
+        values.add(row[0])
+        count += 1
+    return values, count
+
+
+@pytest.mark.parametrize(
+    ('fixture_name', 'filters', 'limit', 'e_attr_sets', 'db_field',
+     'e_db_set'),
+    MULTIFILTER_CASES)
+def test_get_filings_multifilter(
+        fixture_name, filters, limit, e_attr_sets, db_field, e_db_set,
+        request):
+    """Requested multifilter filings are returned."""
+    request.getfixturevalue(fixture_name)
     fs = xf.get_filings(
-        filters={
-            'filing_index': filing_index_codes
-            },
+        filters=filters,
         sort=None,
-        limit=2,
+        limit=limit,
         flags=xf.GET_ONLY_FILINGS
         )
-    received_countries = {filing.filing_index for filing in fs}
-    assert received_countries == set(filing_index_codes)
+    assert len(fs) == limit, 'Requested number of filings returned'
+    for attr_name, e_set in e_attr_sets.items():
+        received = {getattr(filing, attr_name) for filing in fs}
+        assert received == e_set
 
 
 @pytest.mark.sqlite
-def test_to_sqlite_filing_index(
-        multifilter_filing_index_response, db_record_count, tmp_path,
-        monkeypatch):
-    """Filtering by `filing_index` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    filing_index_codes = (
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-GB-0',
-        '21380068P1DRHMJ8KU70-2021-12-31-ESEF-NL-0'
-        )
-    db_path = tmp_path / 'test_to_sqlite_filing_index.db'
+@pytest.mark.parametrize(
+    ('fixture_name', 'filters', 'limit', 'e_attr_sets', 'db_field',
+     'e_db_set'),
+    MULTIFILTER_CASES)
+def test_to_sqlite_multifilter(
+        fixture_name, filters, limit, e_attr_sets, db_field, e_db_set,
+        request, open_test_db, sqlite_tmp_dir):
+    """Multifilter filings are inserted to db."""
+    request.getfixturevalue(fixture_name)
+    db_path = (
+        sqlite_tmp_dir
+        / f'test_to_sqlite_multifilter_{db_field}_{uuid4().hex[:8]}.db')
     xf.to_sqlite(
         path=db_path,
         update=False,
-        filters={
-            'filing_index': filing_index_codes
-            },
+        filters=filters,
         sort=None,
-        limit=2,
+        limit=limit,
         flags=xf.GET_ONLY_FILINGS
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT filing_index FROM Filing "
-        "WHERE filing_index IN (?, ?)",
-        filing_index_codes
-        )
-    saved_fxo = {row[0] for row in cur.fetchall()}
-    assert saved_fxo == set(filing_index_codes)
-    assert db_record_count(cur) == 2
+    con, cur = open_test_db(db_path)
+    saved_values, count = _fetch_column_and_count(cur, db_field)
+    assert saved_values == e_db_set
+    assert count == limit
     con.close()
 
 
@@ -185,13 +162,14 @@ def test_get_filings_reporting_date(multifilter_reporting_date_response):
 
 @pytest.mark.sqlite
 def test_to_sqlite_reporting_date(
-        multifilter_reporting_date_response, tmp_path, monkeypatch):
+        multifilter_reporting_date_response, sqlite_tmp_dir):
     """
     Test raising APIError for `reporting_date` filtering, to_sqlite.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     dates = '2020-12-31', '2021-12-31', '2022-12-31'
-    db_path = tmp_path / 'test_to_sqlite_reporting_date.db'
+    db_path = sqlite_tmp_dir / (
+        'test_to_sqlite_reporting_date_'
+        f'{uuid4().hex[:8]}.db')
     with pytest.raises(xf.APIError, match=r'FilingSchema has no attribute'):
         with pytest.warns(xf.FilterNotSupportedWarning):
             xf.to_sqlite(
@@ -207,88 +185,15 @@ def test_to_sqlite_reporting_date(
     assert not db_path.is_file()
 
 
-@pytest.mark.datetime
-def test_get_filings_processed_time_str(
-        multifilter_processed_time_response):
-    """Test string filtered `processed_time` returns 2 filings."""
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
-        )
-    fs = xf.get_filings(
-        filters={
-            'processed_time': cloetta_sv_strs
-            },
-        sort=None,
-        limit=2,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    received_dts = {filing.processed_time for filing in fs}
-    assert cloetta_sv_objs[0] in received_dts
-    assert cloetta_sv_objs[1] in received_dts
-    assert len(received_dts) == 2
-    received_strs = {filing.processed_time_str for filing in fs}
-    assert cloetta_sv_strs[0] in received_strs
-    assert cloetta_sv_strs[1] in received_strs
-
-
-@pytest.mark.sqlite
-@pytest.mark.datetime
-def test_to_sqlite_processed_time_str(
-        multifilter_processed_time_response, db_record_count, tmp_path,
-        monkeypatch):
-    """Test string filtered `processed_time` filings inserted to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
-    db_path = tmp_path / 'test_to_sqlite_processed_time_str.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'processed_time': cloetta_sv_strs
-            },
-        sort=None,
-        limit=2,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT processed_time FROM Filing "
-        "WHERE processed_time IN (?, ?)",
-        cloetta_sv_strs
-        )
-    saved_proc_times = {row[0] for row in cur.fetchall()}
-    assert saved_proc_times == set(cloetta_sv_strs)
-    assert db_record_count(cur) == 2
-    con.close()
-
-
 @pytest.mark.datetime
 def test_get_filings_processed_time_datetime_utc(
         multifilter_processed_time_response):
     """
     Test datetime (UTC) filtered `processed_time` returns 2 filings.
     """
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=UTC),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=UTC)
-        )
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
     fs = xf.get_filings(
         filters={
-            'processed_time': cloetta_sv_objs
+            'processed_time': CLOETTA_SV_OBJS
             },
         sort=None,
         limit=2,
@@ -296,11 +201,11 @@ def test_get_filings_processed_time_datetime_utc(
         )
     received_dts = {filing.processed_time for filing in fs}
     assert len(received_dts) == 2
-    for utc_dt in cloetta_sv_objs:
+    for utc_dt in CLOETTA_SV_OBJS:
         assert utc_dt in received_dts
     received_strs = {filing.processed_time_str for filing in fs}
     assert len(received_strs) == 2
-    for str_dt in cloetta_sv_strs:
+    for str_dt in CLOETTA_SV_STRS:
         assert str_dt in received_strs
 
 
@@ -310,17 +215,9 @@ def test_get_filings_processed_time_datetime_naive(
     """
     Test datetime (naive) filtered `processed_time` returns 2 filings.
     """
-    cloetta_sv_objs = (
-        datetime(2023, 1, 18, 11, 2, 6, 724768, tzinfo=None),
-        datetime(2023, 5, 16, 21, 7, 17, 825836, tzinfo=None)
-        )
-    cloetta_sv_strs = (
-        '2023-01-18 11:02:06.724768',
-        '2023-05-16 21:07:17.825836'
-        )
     fs = xf.get_filings(
         filters={
-            'processed_time': cloetta_sv_objs
+            'processed_time': CLOETTA_SV_NAIVE_OBJS
             },
         sort=None,
         limit=2,
@@ -328,10 +225,10 @@ def test_get_filings_processed_time_datetime_naive(
         )
     received_dts = {filing.processed_time for filing in fs}
     assert len(received_dts) == 2
-    for naive_dt in cloetta_sv_objs:
+    for naive_dt in CLOETTA_SV_NAIVE_OBJS:
         assert naive_dt.replace(tzinfo=UTC) in received_dts
     received_strs = {filing.processed_time_str for filing in fs}
-    for str_dt in cloetta_sv_strs:
+    for str_dt in CLOETTA_SV_STRS:
         assert str_dt in received_strs
 
 
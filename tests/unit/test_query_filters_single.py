@@ -12,8 +12,8 @@ Single filter is a literal value for filter, unlike multifilter
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
-import sqlite3
 from datetime import date, datetime, timezone
+from uuid import uuid4
 
 import pytest
 
@@ -21,91 +21,118 @@ import xbrl_filings_api as xf
 
 UTC = timezone.utc
 
-
-def test_get_filings_api_id(creditsuisse21en_by_id_response):
-    """Requested `api_id` is returned."""
-    creditsuisse21en_api_id = '162'
-    fs = xf.get_filings(
-        filters={
-            'api_id': creditsuisse21en_api_id
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    creditsuisse21 = next(iter(fs), None)
-    assert isinstance(creditsuisse21, xf.Filing)
-    assert creditsuisse21.api_id == creditsuisse21en_api_id
-
-
-@pytest.mark.sqlite
-def test_to_sqlite_api_id(
-    creditsuisse21en_by_id_response, db_record_count, tmp_path, monkeypatch):
-    """Requested `api_id` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    creditsuisse21en_api_id = '162'
-    db_path = tmp_path / 'test_to_sqlite_api_id.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'api_id': creditsuisse21en_api_id
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM Filing WHERE api_id = ?",
-        (creditsuisse21en_api_id,)
-        )
-    assert cur.fetchone() == (1,), 'Inserted requested filing(s)'
-    assert db_record_count(cur) == 1
-    con.close()
-
-
-def test_get_filings_filing_index(asml22en_response):
-    """Requested `filing_index` is returned."""
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
+ASML22_FXO = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
+CREDITSUISSE21_API_ID = '162'
+KONE22_SHA = (
+    'e489a512976f55792c31026457e86c9176d258431f9ed645451caff9e4ef5f80')
+
+SINGLE_FILTER_CASES = [
+    pytest.param(
+        'creditsuisse21en_by_id_response',
+        {'api_id': CREDITSUISSE21_API_ID},
+        {'api_id': CREDITSUISSE21_API_ID},
+        CREDITSUISSE21_API_ID,
+        id='api_id'),
+    pytest.param(
+        'asml22en_response',
+        {'filing_index': ASML22_FXO},
+        {'filing_index': ASML22_FXO},
+        ASML22_FXO,
+        id='filing_index'),
+    pytest.param(
+        'filter_last_end_date_response',
+        {'last_end_date': '2021-02-28'},
+        {'last_end_date': date(2021, 2, 28)},
+        '2021-02-28',
+        marks=pytest.mark.date,
+        id='last_end_date_str'),
+    pytest.param(
+        'filter_last_end_date_response',
+        {'last_end_date': date(2021, 2, 28)},
+        {'last_end_date': date(2021, 2, 28)},
+        '2021-02-28',
+        marks=pytest.mark.date,
+        id='last_end_date_obj'),
+    pytest.param(
+        'filter_added_time_2_response',
+        {'added_time': '2023-05-09 13:27:02.676029'},
+        {
+            'added_time': datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC),
+            'added_time_str': '2023-05-09 13:27:02.676029'
+        },
+        '2023-05-09 13:27:02.676029',
+        marks=pytest.mark.datetime,
+        id='added_time_str_exact'),
+    pytest.param(
+        'filter_added_time_2_response',
+        {'added_time': datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC)},
+        {
+            'added_time': datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC),
+            'added_time_str': '2023-05-09 13:27:02.676029'
+        },
+        '2023-05-09 13:27:02.676029',
+        marks=pytest.mark.datetime,
+        id='added_time_datetime_utc'),
+    pytest.param(
+        'filter_package_sha256_response',
+        {'package_sha256': KONE22_SHA},
+        {'package_sha256': KONE22_SHA},
+        KONE22_SHA,
+        id='package_sha256'),
+    ]
+"""Rows ``(fixture_name, filters, e_attrs, e_db_value)``."""
+
+
+def _assert_single_filing(fs, **expected):
+    """Assert `fs` has a single Filing with expected attributes."""
+    filings = list(fs)
+    assert len(filings) == 1
+    filing = filings[0]
+    assert isinstance(filing, xf.Filing)
+    for attr_name, e_value in expected.items():
+        assert getattr(filing, attr_name) == e_value
+
+
+@pytest.mark.parametrize(
+    ('fixture_name', 'filters', 'e_attrs', 'e_db_value'),
+    SINGLE_FILTER_CASES)
+def test_get_filings_single_filter(
+        fixture_name, filters, e_attrs, e_db_value, request):
+    """Single filtered query returns the requested filing."""
+    request.getfixturevalue(fixture_name)
     fs = xf.get_filings(
-        filters={
-            'filing_index': asml22_fxo
-            },
+        filters=filters,
         sort=None,
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
-    asml22 = next(iter(fs), None)
-    assert isinstance(asml22, xf.Filing)
-    assert asml22.filing_index == asml22_fxo
+    _assert_single_filing(fs, **e_attrs)
 
 
 @pytest.mark.sqlite
-def test_to_sqlite_filing_index(
-        asml22en_response, db_record_count, tmp_path, monkeypatch):
-    """Requested `filing_index` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    asml22_fxo = '724500Y6DUVHQD6OXN27-2022-12-31-ESEF-NL-0'
-    db_path = tmp_path / 'test_to_sqlite_filing_index.db'
+@pytest.mark.parametrize(
+    ('fixture_name', 'filters', 'e_attrs', 'e_db_value'),
+    SINGLE_FILTER_CASES)
+def test_to_sqlite_single_filter(
+        fixture_name, filters, e_attrs, e_db_value, request, db_record_count,
+        open_test_db, sqlite_tmp_dir):
+    """Single filtered query filing is inserted into a database."""
+    request.getfixturevalue(fixture_name)
+    field = next(iter(filters))
+    db_path = sqlite_tmp_dir / f'test_to_sqlite_{field}_{uuid4().hex[:8]}.db'
     xf.to_sqlite(
         path=db_path,
         update=False,
-        filters={
-            'filing_index': asml22_fxo
-            },
+        filters=filters,
         sort=None,
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
+    con, cur = open_test_db(db_path)
     cur.execute(
-        "SELECT COUNT(*) FROM Filing WHERE filing_index = ?",
-        (asml22_fxo,)
+        f"SELECT COUNT(*) FROM Filing WHERE {field} = ?",  # noqa: S608
+        (e_db_value,)
         )
     assert cur.fetchone() == (1,), 'Inserted requested filing(s)'
     assert db_record_count(cur) == 1
@@ -128,10 +155,9 @@ def test_get_filings_language(filter_language_response):
 
 @pytest.mark.sqlite
 def test_to_sqlite_language(
-    filter_language_response, tmp_path, monkeypatch):
+    filter_language_response, sqlite_tmp_dir):
     """Filter `language` raises an `APIError` for to_sqlite."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    db_path = tmp_path / 'test_to_sqlite_language.db'
+    db_path = sqlite_tmp_dir / f'test_to_sqlite_language_{uuid4().hex[:8]}.db'
     with pytest.raises(xf.APIError, match=r'Bad filter value'):
         with pytest.warns(xf.FilterNotSupportedWarning):
             xf.to_sqlite(
@@ -147,105 +173,6 @@ def test_to_sqlite_language(
     assert not db_path.is_file()
 
 
-@pytest.mark.date
-def test_get_filings_last_end_date_str(filter_last_end_date_response):
-    """String filtered `last_end_date` returns filing(s)."""
-    date_str = '2021-02-28'
-    fs = xf.get_filings(
-        filters={
-            'last_end_date': date_str
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    agrana20 = next(iter(fs), None)
-    assert isinstance(agrana20, xf.Filing)
-    expected_date = date(*[int(pt) for pt in date_str.split('-')])
-    assert agrana20.last_end_date == expected_date
-
-
-@pytest.mark.sqlite
-@pytest.mark.date
-def test_to_sqlite_last_end_date_str(
-        filter_last_end_date_response, db_record_count, tmp_path, monkeypatch):
-    """String filtered `last_end_date` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    date_str = '2021-02-28'
-    db_path = tmp_path / 'test_to_sqlite_last_end_date.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'last_end_date': date_str
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM Filing WHERE last_end_date = ?",
-        (date_str,)
-        )
-    count_num = cur.fetchone()[0]
-    assert count_num == 1, 'Inserted requested filing(s)'
-    assert db_record_count(cur) == 1
-    con.close()
-
-
-@pytest.mark.date
-def test_get_filings_last_end_date_obj(filter_last_end_date_response):
-    """Date object filtered `last_end_date` returns filing(s)."""
-    date_obj = date(2021, 2, 28)
-    fs = xf.get_filings(
-        filters={
-            'last_end_date': date_obj
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    agrana20 = next(iter(fs), None)
-    assert isinstance(agrana20, xf.Filing)
-    assert agrana20.last_end_date == date_obj
-
-
-@pytest.mark.sqlite
-@pytest.mark.date
-def test_to_sqlite_last_end_date_obj(
-        filter_last_end_date_response, db_record_count, tmp_path, monkeypatch):
-    """
-    Date object filtered `last_end_date` is inserted into a database.
-    """
-    monkeypatch.setattr(xf.options, 'views', None)
-    date_obj = date(2021, 2, 28)
-    db_path = tmp_path / 'test_to_sqlite_last_end_date.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'last_end_date': date_obj
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM Filing WHERE last_end_date = ?",
-        (date_obj.strftime('%Y-%m-%d'),)
-        )
-    count_num = cur.fetchone()[0]
-    assert count_num == 1, 'Inserted requested filing(s)'
-    assert db_record_count(cur) == 1
-    con.close()
-
-
 @pytest.mark.date
 def test_get_filings_last_end_date_datetime(
         filter_last_end_date_lax_response):
@@ -268,12 +195,13 @@ def test_get_filings_last_end_date_datetime(
 @pytest.mark.sqlite
 @pytest.mark.date
 def test_to_sqlite_last_end_date_datetime(
-        filter_last_end_date_lax_response, tmp_path, monkeypatch
+        filter_last_end_date_lax_response, sqlite_tmp_dir
         ):
     """Datetime filtered `last_end_date` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
     dt_obj = datetime(2021, 2, 28, tzinfo=UTC)
-    db_path = tmp_path / 'test_to_sqlite_last_end_date.db'
+    db_path = sqlite_tmp_dir / (
+        'test_to_sqlite_last_end_date_'
+        f'{uuid4().hex[:8]}.db')
     with pytest.raises(
         expected_exception=ValueError,
         match=r'Not possible to filter date field "\w+" by datetime'
@@ -292,7 +220,7 @@ def test_to_sqlite_last_end_date_datetime(
 
 @pytest.mark.datetime
 def test_get_filings_added_time_str_datelike(
-        filter_added_time_response, monkeypatch):
+        filter_added_time_response):
     """String filtered date-like `added_time` returns filing(s)."""
     time_str = '2021-09-23 00:00:00'
     time_utc = datetime(2021, 9, 23, tzinfo=UTC)
@@ -304,120 +232,12 @@ def test_get_filings_added_time_str_datelike(
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
-    vtbbank20 = next(iter(fs), None)
-    assert isinstance(vtbbank20, xf.Filing)
-    assert vtbbank20.added_time_str == time_str
-    assert vtbbank20.added_time == time_utc
-
-
-@pytest.mark.datetime
-def test_get_filings_added_time_str_exact(
-        filter_added_time_2_response, monkeypatch):
-    """String filtered exact `added_time` returns filing(s)."""
-    time_str = '2023-05-09 13:27:02.676029'
-    time_utc = datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC)
-    fs = xf.get_filings(
-        filters={
-            'added_time': time_str
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    vtbbank20 = next(iter(fs), None)
-    assert isinstance(vtbbank20, xf.Filing)
-    assert vtbbank20.added_time_str == time_str
-    assert vtbbank20.added_time == time_utc
-
-
-@pytest.mark.sqlite
-@pytest.mark.datetime
-def test_to_sqlite_added_time_str_exact(
-        filter_added_time_2_response, db_record_count, tmp_path, monkeypatch):
-    """String filtered `added_time` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    time_str = '2023-05-09 13:27:02.676029'
-    db_path = tmp_path / 'test_to_sqlite_added_time_str_exact.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'added_time': time_str
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT count(*) FROM Filing WHERE added_time = ?",
-        (time_str,)
-        )
-    correct_count = cur.fetchone()[0]
-    assert correct_count == 1, 'Inserted filing'
-    assert db_record_count(cur) == 1
-    con.close()
-
-
-@pytest.mark.datetime
-def test_get_filings_added_time_datetime_utc(
-        filter_added_time_2_response, monkeypatch):
-    """Datetime (UTC) filtered `added_time` returns filing(s)."""
-    dt_obj = datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC)
-    time_str = '2023-05-09 13:27:02.676029'
-    fs = xf.get_filings(
-        filters={
-            'added_time': dt_obj
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    vtbbank20 = next(iter(fs), None)
-    assert isinstance(vtbbank20, xf.Filing)
-    assert vtbbank20.added_time == dt_obj
-    assert vtbbank20.added_time_str == time_str
-
-
-@pytest.mark.sqlite
-@pytest.mark.datetime
-def test_to_sqlite_added_time_datetime_utc(
-        filter_added_time_2_response, db_record_count, tmp_path, monkeypatch):
-    """
-    Datetime (UTC) filtered `added_time` is inserted into a database.
-    """
-    monkeypatch.setattr(xf.options, 'views', None)
-    dt_obj = datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=UTC)
-    e_time_str = '2023-05-09 13:27:02.676029'
-    db_path = tmp_path / 'test_to_sqlite_added_time_datetime_utc.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'added_time': dt_obj
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT count(*) FROM Filing WHERE added_time = ?",
-        (e_time_str,)
-        )
-    correct_count = cur.fetchone()[0]
-    assert correct_count == 1, 'Inserted filing'
-    assert db_record_count(cur) == 1
-    con.close()
+    _assert_single_filing(fs, added_time_str=time_str, added_time=time_utc)
 
 
 @pytest.mark.datetime
 def test_get_filings_added_time_datetime_naive(
-        filter_added_time_2_response, monkeypatch):
+        filter_added_time_2_response):
     """Datetime (naive) filtered `added_time` returns filing(s)."""
     dt_obj = datetime(2023, 5, 9, 13, 27, 2, 676029, tzinfo=None)
     time_str = '2023-05-09 13:27:02.676029'
@@ -429,10 +249,8 @@ def test_get_filings_added_time_datetime_naive(
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
-    vtbbank20 = next(iter(fs), None)
-    assert isinstance(vtbbank20, xf.Filing)
-    assert vtbbank20.added_time == dt_obj.replace(tzinfo=UTC)
-    assert vtbbank20.added_time_str == time_str
+    _assert_single_filing(
+        fs, added_time=dt_obj.replace(tzinfo=UTC), added_time_str=time_str)
 
 
 @pytest.mark.datetime
@@ -456,13 +274,14 @@ def test_get_filings_added_time_date(filter_added_time_lax_response):
 @pytest.mark.sqlite
 @pytest.mark.datetime
 def test_to_sqlite_added_time_date(
-        filter_added_time_lax_response, tmp_path, monkeypatch):
+        filter_added_time_lax_response, sqlite_tmp_dir):
     """
     Date object filtered `added_time` for database raises ValueError.
     """
-    monkeypatch.setattr(xf.options, 'views', None)
     date_obj = date(2021, 9, 23)
-    db_path = tmp_path / 'test_to_sqlite_added_time_date.db'
+    db_path = sqlite_tmp_dir / (
+        'test_to_sqlite_added_time_date_'
+        f'{uuid4().hex[:8]}.db')
     with pytest.raises(
         expected_exception=ValueError,
         match=r'Not possible to filter datetime field "\w+" by date'
@@ -481,7 +300,7 @@ def test_to_sqlite_added_time_date(
 
 
 @pytest.mark.datetime
-def test_get_filings_added_time_bad_datetime(monkeypatch):
+def test_get_filings_added_time_bad_datetime():
     """Test raising for bad string filtered `added_time`."""
     time_str = '2021-99-99 99:99:99'
     with pytest.raises(
@@ -513,55 +332,6 @@ def test_get_filings_entity_api_id(filter_entity_api_id_lax_response):
                 )
 
 
-def test_get_filings_package_sha256(filter_package_sha256_response):
-    """Querying `package_sha256` returns filing(s)."""
-    filter_sha = (
-        'e489a512976f55792c31026457e86c9176d258431f9ed645451caff9e4ef5f80')
-    fs = xf.get_filings(
-        filters={
-            'package_sha256': filter_sha
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    kone22en = next(iter(fs), None)
-    assert isinstance(kone22en, xf.Filing)
-    assert kone22en.package_sha256 == filter_sha
-
-
-@pytest.mark.sqlite
-def test_to_sqlite_package_sha256(
-        filter_package_sha256_response, db_record_count, tmp_path,
-        monkeypatch):
-    """Requested `package_sha256` is inserted into a database."""
-    monkeypatch.setattr(xf.options, 'views', None)
-    filter_sha = (
-        'e489a512976f55792c31026457e86c9176d258431f9ed645451caff9e4ef5f80')
-    db_path = tmp_path / 'test_to_sqlite_package_sha256.db'
-    xf.to_sqlite(
-        path=db_path,
-        update=False,
-        filters={
-            'package_sha256': filter_sha
-            },
-        sort=None,
-        limit=1,
-        flags=xf.GET_ONLY_FILINGS
-        )
-    assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM Filing WHERE package_sha256 = ?",
-        (filter_sha,)
-        )
-    count_num = cur.fetchone()[0]
-    assert count_num == 1, 'Inserted requested filing(s)'
-    assert db_record_count(cur) == 1
-    con.close()
-
-
 @pytest.mark.date
 def test_get_filings_2filters_country_last_end_date_str(
         finnish_jan22_response):
@@ -583,11 +353,12 @@ def test_get_filings_2filters_country_last_end_date_str(
 @pytest.mark.sqlite
 @pytest.mark.date
 def test_to_sqlite_2filters_country_last_end_date_str(
-        finnish_jan22_response, db_record_count, tmp_path, monkeypatch):
+        finnish_jan22_response, db_record_count, open_test_db, sqlite_tmp_dir):
     """Filters `country` and `last_end_date` insert 2 filings to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
     db_path = (
-        tmp_path / 'test_to_sqlite_2filters_country_last_end_date_str.db')
+        sqlite_tmp_dir
+        / ('test_to_sqlite_2filters_country_last_end_date_str_'
+           f'{uuid4().hex[:8]}.db'))
     xf.to_sqlite(
         path=db_path,
         update=False,
@@ -600,17 +371,15 @@ def test_to_sqlite_2filters_country_last_end_date_str(
         flags=xf.GET_ONLY_FILINGS
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
+    con, cur = open_test_db(db_path)
     cur.execute(
         "SELECT filing_index FROM Filing "
         "WHERE country = ? AND last_end_date = ?",
         ('FI', '2022-01-31')
         )
-    fxo_a = cur.fetchone()[0]
-    fxo_b = cur.fetchone()[0]
-    assert fxo_a != fxo_b, 'Filings are unique'
-    assert cur.fetchone() is None, 'Two filings inserted'
+    saved_fxos = cur.fetchall()
+    assert len(saved_fxos) == 2, 'Two filings inserted'
+    assert saved_fxos[0] != saved_fxos[1], 'Filings are unique'
     assert db_record_count(cur) == 2
     con.close()
 
@@ -636,11 +405,12 @@ def test_get_filings_2filters_country_last_end_date_date(
 @pytest.mark.sqlite
 @pytest.mark.date
 def test_to_sqlite_2filters_country_last_end_date_date(
-    finnish_jan22_response, db_record_count, tmp_path, monkeypatch):
+    finnish_jan22_response, db_record_count, open_test_db, sqlite_tmp_dir):
     """Filters `country` and `last_end_date` as date insert to db."""
-    monkeypatch.setattr(xf.options, 'views', None)
     db_path = (
-        tmp_path / 'test_to_sqlite_2filters_country_last_end_date_date.db')
+        sqlite_tmp_dir
+        / ('test_to_sqlite_2filters_country_last_end_date_date_'
+           f'{uuid4().hex[:8]}.db'))
     xf.to_sqlite(
         path=db_path,
         update=False,
@@ -653,21 +423,66 @@ def test_to_sqlite_2filters_country_last_end_date_date(
         flags=xf.GET_ONLY_FILINGS
         )
     assert db_path.is_file()
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
+    con, cur = open_test_db(db_path)
     cur.execute(
         "SELECT filing_index FROM Filing "
         "WHERE country = ? AND last_end_date = ?",
         ('FI', '2022-01-31')
         )
-    fxo_a = cur.fetchone()[0]
-    fxo_b = cur.fetchone()[0]
-    assert fxo_a != fxo_b, 'Filings are unique'
-    assert cur.fetchone() is None, 'Two filings inserted'
+    saved_fxos = cur.fetchall()
+    assert len(saved_fxos) == 2, 'Two filings inserted'
+    assert saved_fxos[0] != saved_fxos[1], 'Filings are unique'
     assert db_record_count(cur) == 2
     con.close()
 
 
+@pytest.mark.sqlite
+@pytest.mark.date
+def test_to_sqlite_2filters_insert_batched(
+        finnish_jan22_response, sqlite_tmp_dir, monkeypatch):
+    """Filing records are inserted in a single executemany batch."""
+    import sqlite3
+    execute_sqls = []
+    executemany_sqls = []
+
+    class SpyCursor(sqlite3.Cursor):
+        def execute(self, sql, *args):
+            execute_sqls.append(sql)
+            return super().execute(sql, *args)
+        def executemany(self, sql, rows):
+            executemany_sqls.append(sql)
+            return super().executemany(sql, rows)
+
+    class SpyConnection(sqlite3.Connection):
+        def cursor(self, factory=SpyCursor):
+            return super().cursor(factory)
+
+    orig_connect = sqlite3.connect
+    def spy_connect(*args, **kwargs):
+        kwargs.setdefault('factory', SpyConnection)
+        return orig_connect(*args, **kwargs)
+    monkeypatch.setattr(sqlite3, 'connect', spy_connect)
+    db_path = sqlite_tmp_dir / (
+        'test_to_sqlite_2filters_insert_batched_'
+        f'{uuid4().hex[:8]}.db')
+    xf.to_sqlite(
+        path=db_path,
+        update=False,
+        filters={
+            'country': 'FI',
+            'last_end_date': '2022-01-31'
+            },
+        sort=None,
+        limit=2,
+        flags=xf.GET_ONLY_FILINGS
+        )
+    assert db_path.is_file()
+    row_inserts = [sql for sql in execute_sqls if 'INTO Filing' in sql]
+    batch_inserts = [sql for sql in executemany_sqls if 'INTO Filing' in sql]
+    assert row_inserts == [], 'No per-record INSERT statements'
+    assert len(batch_inserts) == 1, 'Records inserted in one batch'
+
+
 def test_raises_get_filings_none_filter():
     """Test raising for filter value None."""
     with pytest.raises(
@@ -18,7 +18,8 @@ def test_get_filings_flag_only_filings(asml22en_response):
         limit=1,
         flags=xf.GET_ONLY_FILINGS
         )
-    asml22 = next(iter(fs), None)
+    assert len(fs) == 1
+    (asml22,) = fs
     assert asml22.entity is None, 'No entities'
     assert asml22.validation_messages is None, 'No messages'
 
@@ -34,7 +35,8 @@ def test_get_filings_flag_entities(asml22en_entities_response):
         limit=1,
         flags=xf.GET_ENTITY
         )
-    asml22 = next(iter(fs), None)
+    assert len(fs) == 1
+    (asml22,) = fs
     assert asml22.validation_messages is None, 'No messages'
     assert isinstance(asml22.entity, xf.Entity), 'xf.Entity is available'
     assert asml22.entity.name == 'ASML Holding N.V.', 'Accessible'
@@ -51,7 +53,8 @@ def test_get_filings_flag_vmessages(asml22en_vmessages_response):
         limit=1,
         flags=xf.GET_VALIDATION_MESSAGES
         )
-    asml22 = next(iter(fs), None)
+    assert len(fs) == 1
+    (asml22,) = fs
     assert asml22.entity is None, 'No entity'
     vmsg = next(iter(asml22.validation_messages), None)
     assert isinstance(vmsg, xf.ValidationMessage), 'Messages available'
@@ -69,7 +72,8 @@ def test_get_filings_flag_only_filings_and_entities(asml22en_response):
         limit=1,
         flags=xf.GET_ONLY_FILINGS | xf.GET_ENTITY
         )
-    asml22 = next(iter(fs), None)
+    assert len(fs) == 1
+    (asml22,) = fs
     assert asml22.entity is None, 'No entities'
     assert asml22.validation_messages is None, 'No messages'
 
@@ -85,7 +89,8 @@ def test_get_filings_flag_entities_vmessages(asml22en_ent_vmsg_response):
         limit=1,
         flags=xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
         )
-    asml22 = next(iter(fs), None)
+    assert len(fs) == 1
+    (asml22,) = fs
     assert isinstance(asml22.entity, xf.Entity), 'xf.Entity available'
     vmsg = next(iter(asml22.validation_messages), None)
     assert isinstance(vmsg, xf.ValidationMessage), 'Messages available'
@@ -7,6 +7,8 @@
 # Allow unnecessary double quotes as file includes SQL statements.
 # ruff: noqa: Q000
 
+from itertools import islice
+
 import pytest
 
 import xbrl_filings_api as xf
@@ -42,11 +44,12 @@ def test_removing_extra_filings(estonian_2_pages_3_each_response, monkeypatch):
         limit=4,
         flags=xf.GET_ENTITY | xf.GET_VALIDATION_MESSAGES
         )
-    page1_filings = next(piter).filing_list
+    pages = list(islice(piter, 3))
+    assert len(pages) == 2, 'Iterator exhausted after two pages'
+    page1_filings = pages[0].filing_list
     assert len(page1_filings) == 3
-    page2_filings = next(piter).filing_list
+    page2_filings = pages[1].filing_list
     assert len(page2_filings) == 1, 'Remove 2 unnecessary filings'
-    assert next(piter, None) is None
     received_api_ids = set(page1_filings + page2_filings)
     assert len(received_api_ids) == 4, 'Receive 4 unique api_id values'
 
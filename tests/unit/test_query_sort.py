@@ -15,9 +15,11 @@ import xbrl_filings_api as xf
 
 UTC = timezone.utc
 
+DATE_MAX_20210518 = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
+
 
 @pytest.mark.datetime
-def test_sort_oldest_finnish_str(oldest3_fi_response, monkeypatch):
+def test_sort_oldest_finnish_str(oldest3_fi_response):
     """Sort by string `added_time` for filings from Finland."""
     fs = xf.get_filings(
         filters={
@@ -27,13 +29,12 @@ def test_sort_oldest_finnish_str(oldest3_fi_response, monkeypatch):
         limit=3,
         flags=xf.GET_ONLY_FILINGS
         )
-    date_max = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
     for f in fs:
-        assert f.added_time < date_max, 'Before 2021-05-18T00:00:01Z'
+        assert f.added_time < DATE_MAX_20210518, 'Before 2021-05-18T00:00:01Z'
 
 
 @pytest.mark.datetime
-def test_sort_oldest_finnish_list(oldest3_fi_response, monkeypatch):
+def test_sort_oldest_finnish_list(oldest3_fi_response):
     """Sort by list of string `added_time` for filings from Finland."""
     fs = xf.get_filings(
         filters={
@@ -43,9 +44,8 @@ def test_sort_oldest_finnish_list(oldest3_fi_response, monkeypatch):
         limit=3,
         flags=xf.GET_ONLY_FILINGS
         )
-    date_max = datetime(2021, 5, 18, 0, 0, 1, tzinfo=UTC)
     for f in fs:
-        assert f.added_time < date_max, 'Before 2021-05-18T00:00:01Z'
+        assert f.added_time < DATE_MAX_20210518, 'Before 2021-05-18T00:00:01Z'
 
 
 def test_sort_two_fields(sort_two_fields_response):
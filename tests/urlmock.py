@@ -2,34 +2,170 @@
 Define class `UrlMock` for test fixture `urlmock`.
 
 .. note::
-    Method `apply` uses beta feature `responses._add_from_file` (as of
-    `responses` version 0.23.3).
+    Method `apply` mirrors beta feature `responses._add_from_file` (as
+    of `responses` version 0.23.3).
 """
 
 # SPDX-FileCopyrightText: 2023 Lauri Salmela <lauri.m.salmela@gmail.com>
 #
 # SPDX-License-Identifier: MIT
 
+import concurrent.futures
+import os
+import pickle
 from pathlib import Path
 from types import ModuleType
 from typing import Union
 
 import responses
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 MOCK_URL_PATH = Path(__file__).parent / 'mock_responses'
 
+_params_cache: dict = {}
+"""Parsed response parameter tuples, keyed by absolute file path."""
+
+
+def load_params_cache(cache_path):
+    """
+    Seed the parse cache from a pickle file of an earlier test run.
+
+    Entries whose mock response file has been modified or deleted
+    after the pickle was written are skipped. Missing or unreadable
+    pickle files are ignored silently.
+
+    Parameters
+    ----------
+    cache_path : path-like
+        File path of the pickle written by `save_params_cache`.
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            stored = pickle.load(file)  # noqa: S301 # Local test cache
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return
+    for file_path, (mtime, params_list) in stored.items():
+        try:
+            current_mtime = os.path.getmtime(file_path)
+        except OSError:
+            continue
+        if current_mtime == mtime:
+            _params_cache[file_path] = params_list
+
+
+def save_params_cache(cache_path):
+    """
+    Save the parse cache to a pickle file for later test runs.
+
+    The pickle is written to a temporary file and moved in place
+    atomically so parallel test workers (e.g. pytest-xdist) never
+    leave a partially written file behind.
+
+    Parameters
+    ----------
+    cache_path : path-like
+        File path of the pickle read by `load_params_cache`.
+    """
+    stored = {}
+    for file_path, params_list in _params_cache.items():
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            continue
+        stored[file_path] = (mtime, params_list)
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as file:
+        pickle.dump(stored, file)
+    os.replace(temp_path, cache_path)
+
+
+def _read_response_params(file_path: str):
+    """
+    Parse a mock URL response YAML file into `responses.add` kwargs.
+
+    Parsed files are cached for the whole test run as the files never
+    change during one. The returned keyword argument dicts follow the
+    logic of beta feature `responses.RequestsMock._add_from_file` (as
+    of `responses` version 0.23.3).
+
+    Parameters
+    ----------
+    file_path : str
+        Absolute file path of the mock URL response file.
+    """
+    cached = _params_cache.get(file_path)
+    if cached is not None:
+        return cached
+    with open(file_path, encoding='utf-8') as file:
+        data = yaml.load(file, Loader=_YamlLoader)
+    params_list = []
+    for rsp in data['responses']:
+        params = rsp['response']
+        headers = params['headers'] if 'headers' in params else None
+        if headers is not None and 'content_type' in params:
+            headers = {
+                k: v for k, v in headers.items()
+                if k.lower() != 'content-type'
+                }
+            if not headers:
+                headers = None
+        params_list.append({
+            'method': params['method'],
+            'url': params['url'],
+            'body': params['body'],
+            'status': params['status'],
+            'headers': headers,
+            'content_type': params['content_type'],
+            'auto_calculate_content_length': (
+                params['auto_calculate_content_length']),
+            })
+    _params_cache[file_path] = tuple(params_list)
+    return _params_cache[file_path]
+
 
 class UrlMock:
     """Define operations for URL mock responses."""
 
+    def __init__(self):
+        """Initialize `UrlMock`."""
+        self._path_cache: dict = {}
+
+    def preload(self):
+        """
+        Read and parse all mock response files in one directory scan.
+
+        Fills the parse cache of downloaded mock response files so that
+        `apply` calls never touch the disk on the per-test hot path.
+        The files are read concurrently in a small thread pool to
+        overlap the per-file disk reads on cold caches.
+        """
+        if not MOCK_URL_PATH.is_dir():
+            return
+        with os.scandir(MOCK_URL_PATH) as diriter:
+            paths = [
+                entry.path for entry in diriter
+                if entry.name.endswith('.yaml') and entry.is_file()
+                ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [
+                    pool.submit(_read_response_params, path)
+                    for path in paths]:
+                future.result()
+
     def apply(
             self, rsps: Union[responses.RequestsMock, ModuleType],
             urlmock_name: str):
         """
         Apply the mock URL response on the test for requests library.
 
-        This method uses beta feature `responses._add_from_file` (as of
-        `responses` version 0.23.3).
+        This method mirrors beta feature `responses._add_from_file` (as
+        of `responses` version 0.23.3) but caches the parsed YAML files
+        for the test run.
 
         Parameters
         ----------
@@ -46,7 +182,14 @@ class UrlMock:
                 'not yet downloaded mocks.'
                 )
             raise Exception(msg)
-        rsps._add_from_file(file_path)
+        # Extend the registry in one batch instead of per-response
+        # rsps.add() calls; parse-time handling in
+        # _read_response_params has already validated the headers.
+        registry = getattr(rsps, 'mock', rsps)._registry
+        registry.registered.extend(
+            responses.Response(**params)
+            for params in _read_response_params(file_path)
+            )
 
     def path(self, urlmock_name: str):
         """
@@ -57,5 +200,8 @@ class UrlMock:
         urlmock_name : str
             Name of the URL mock as defined in ``mock_upgrade.py``.
         """
-        file_path = MOCK_URL_PATH / f'{urlmock_name}.yaml'
-        return str(file_path)
+        spath = self._path_cache.get(urlmock_name)
+        if spath is None:
+            spath = str(MOCK_URL_PATH / f'{urlmock_name}.yaml')
+            self._path_cache[urlmock_name] = spath
+        return spath
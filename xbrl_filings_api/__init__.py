@@ -89,40 +89,160 @@ JSONAPIFormatError
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xbrl_filings_api.api_error import APIError
+    from xbrl_filings_api.api_object import APIObject
+    from xbrl_filings_api.api_page import APIPage
+    from xbrl_filings_api.api_resource import APIResource
+    from xbrl_filings_api.constants import NO_LIMIT, api_attribute_map
+    from xbrl_filings_api.default_views import DEFAULT_VIEWS
+    from xbrl_filings_api.download_info import DownloadInfo
+    from xbrl_filings_api.download_item import DownloadItem
+    from xbrl_filings_api.downloader.download_result import DownloadResult
+    from xbrl_filings_api.entity import Entity
+    from xbrl_filings_api.exceptions import (
+        CorruptDownloadError,
+        DatabaseSchemaUnmatchError,
+        FilingsAPIError,
+        FilingsAPIWarning,
+        FilterNotSupportedWarning,
+        HTTPStatusError,
+        JSONAPIFormatError,
+    )
+    from xbrl_filings_api.filing import Filing
+    from xbrl_filings_api.filing_set import FilingSet
+    from xbrl_filings_api.filings_page import FilingsPage
+    from xbrl_filings_api.query import (
+        filing_page_iter,
+        get_filings,
+        to_sqlite,
+    )
+    from xbrl_filings_api.resource_collection import ResourceCollection
+    from xbrl_filings_api.scope_flag import ScopeFlag
+    from xbrl_filings_api.sqlite_view import SQLiteView
+    from xbrl_filings_api.validation_message import ValidationMessage
+
+    GET_ENTITY = ScopeFlag.GET_ENTITY
+    GET_ONLY_FILINGS = ScopeFlag.GET_ONLY_FILINGS
+    GET_VALIDATION_MESSAGES = ScopeFlag.GET_VALIDATION_MESSAGES
+    GET_ALL = GET_ENTITY | GET_VALIDATION_MESSAGES
+
+_EXPORT_MODULES = {
+    'APIError': 'api_error',
+    'APIObject': 'api_object',
+    'APIPage': 'api_page',
+    'APIResource': 'api_resource',
+    'NO_LIMIT': 'constants',
+    'api_attribute_map': 'constants',
+    'DEFAULT_VIEWS': 'default_views',
+    'DownloadInfo': 'download_info',
+    'DownloadItem': 'download_item',
+    'DownloadResult': 'downloader.download_result',
+    'Entity': 'entity',
+    'CorruptDownloadError': 'exceptions',
+    'DatabaseSchemaUnmatchError': 'exceptions',
+    'FilingsAPIError': 'exceptions',
+    'FilingsAPIWarning': 'exceptions',
+    'FilterNotSupportedWarning': 'exceptions',
+    'HTTPStatusError': 'exceptions',
+    'JSONAPIFormatError': 'exceptions',
+    'Filing': 'filing',
+    'FilingSet': 'filing_set',
+    'FilingsPage': 'filings_page',
+    'filing_page_iter': 'query',
+    'get_filings': 'query',
+    'to_sqlite': 'query',
+    'ResourceCollection': 'resource_collection',
+    'ScopeFlag': 'scope_flag',
+    'SQLiteView': 'sqlite_view',
+    'ValidationMessage': 'validation_message',
+    }
+"""Module paths of lazily imported root namespace names."""
+
+_LAZY_SUBMODULES = 'debug', 'downloader', 'options', 'stats'
+"""Non-exporting submodules accessible in the root namespace."""
+
+__all__ = [
+    'DEFAULT_VIEWS',
+    'GET_ALL',
+    'GET_ENTITY',
+    'GET_ONLY_FILINGS',
+    'GET_VALIDATION_MESSAGES',
+    'NO_LIMIT',
+    'APIError',
+    'APIObject',
+    'APIPage',
+    'APIResource',
+    'CorruptDownloadError',
+    'DatabaseSchemaUnmatchError',
+    'DownloadInfo',
+    'DownloadItem',
+    'DownloadResult',
+    'Entity',
+    'Filing',
+    'FilingSet',
+    'FilingsAPIError',
+    'FilingsAPIWarning',
+    'FilingsPage',
+    'FilterNotSupportedWarning',
+    'HTTPStatusError',
+    'JSONAPIFormatError',
+    'ResourceCollection',
+    'SQLiteView',
+    'ScopeFlag',
+    'ValidationMessage',
+    'api_attribute_map',
+    'debug',
+    'downloader',
+    'filing_page_iter',
+    'get_filings',
+    'options',
+    'stats',
+    'to_sqlite',
+    ]
+
+
+def __getattr__(name):
+    """Import and cache root namespace names on first access."""
+    if name in _EXPORT_MODULES:
+        module = importlib.import_module(
+            f'{__name__}.{_EXPORT_MODULES[name]}')
+        value = getattr(module, name)
+    elif name.startswith('GET_'):
+        # Deferred on purpose: resolving lazily is the point of this
+        # module-level __getattr__.
+        from xbrl_filings_api.scope_flag import ScopeFlag  # noqa: PLC0415
+        if name == 'GET_ALL':
+            value = ScopeFlag.GET_ENTITY | ScopeFlag.GET_VALIDATION_MESSAGES
+        else:
+            try:
+                value = ScopeFlag[name]
+            except KeyError:
+                msg = f'module {__name__!r} has no attribute {name!r}'
+                raise AttributeError(msg) from None
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    else:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return root namespace names including lazy ones."""
+    return sorted({
+        *globals(),
+        *_EXPORT_MODULES,
+        *_LAZY_SUBMODULES,
+        'GET_ALL', 'GET_ENTITY', 'GET_ONLY_FILINGS',
+        'GET_VALIDATION_MESSAGES',
+        })
 
-from xbrl_filings_api.api_error import APIError
-from xbrl_filings_api.api_object import APIObject
-from xbrl_filings_api.api_page import APIPage
-from xbrl_filings_api.api_resource import APIResource
-from xbrl_filings_api.constants import NO_LIMIT, api_attribute_map
-from xbrl_filings_api.default_views import DEFAULT_VIEWS
-from xbrl_filings_api.download_info import DownloadInfo
-from xbrl_filings_api.download_item import DownloadItem
-from xbrl_filings_api.downloader.download_result import DownloadResult
-from xbrl_filings_api.entity import Entity
-from xbrl_filings_api.exceptions import (
-    CorruptDownloadError,
-    DatabaseSchemaUnmatchError,
-    FilingsAPIError,
-    FilingsAPIWarning,
-    FilterNotSupportedWarning,
-    HTTPStatusError,
-    JSONAPIFormatError,
-)
-from xbrl_filings_api.filing import Filing
-from xbrl_filings_api.filing_set import FilingSet
-from xbrl_filings_api.filings_page import FilingsPage
-from xbrl_filings_api.query import filing_page_iter, get_filings, to_sqlite
-from xbrl_filings_api.resource_collection import ResourceCollection
-from xbrl_filings_api.scope_flag import ScopeFlag
-from xbrl_filings_api.sqlite_view import SQLiteView
-from xbrl_filings_api.validation_message import ValidationMessage
-
-GET_ENTITY = ScopeFlag.GET_ENTITY
-GET_ONLY_FILINGS = ScopeFlag.GET_ONLY_FILINGS
-GET_VALIDATION_MESSAGES = ScopeFlag.GET_VALIDATION_MESSAGES
-GET_ALL = GET_ENTITY | GET_VALIDATION_MESSAGES
 
 # Do not log error and warning to standard error by default
 logging.getLogger(__name__).addHandler(logging.NullHandler())
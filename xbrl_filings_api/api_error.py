@@ -60,6 +60,10 @@ class APIError(FilingsAPIError, APIObject):
         """HTTP status code description of the reponse."""
 
         self._json.close()
+
+        self._str: Union[str, None] = None
+        """Formatted message cached on first `__str__` call."""
+
         FilingsAPIError.__init__(self)
 
     def __repr__(self) -> str:
@@ -76,19 +80,22 @@ class APIError(FilingsAPIError, APIObject):
         Return "[<`title`> ][ | <`detail`>][ (<`code`>)]".
 
         If only code is defined, return "Code: <``code``>". If none of
-        the three is defined, return empty string.
+        the three is defined, return empty string. The string is built
+        on the first call and cached.
         """
-        pts = []
-        if self.title:
-            pts.append(str(self.title))
-        if self.detail:
+        if self._str is None:
+            pts = []
             if self.title:
-                pts.append('|')
-            pts.append(str(self.detail))
-        if self.code:
-            if len(pts) == 0:
-                pts.append(f'Code: {self.code}')
-            else:
-                pts.append(f'({self.code})')
-        pts = [pt.strip() for pt in pts]
-        return ' '.join(pts)
+                pts.append(str(self.title))
+            if self.detail:
+                if self.title:
+                    pts.append('|')
+                pts.append(str(self.detail))
+            if self.code:
+                if len(pts) == 0:
+                    pts.append(f'Code: {self.code}')
+                else:
+                    pts.append(f'({self.code})')
+            pts = [pt.strip() for pt in pts]
+            self._str = ' '.join(pts)
+        return self._str
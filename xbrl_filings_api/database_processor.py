@@ -27,7 +27,7 @@ from xbrl_filings_api.filing import Filing
 from xbrl_filings_api.scope_flag import ScopeFlag
 from xbrl_filings_api.validation_message import ValidationMessage
 
-__all__ = ['sets_to_sqlite']
+__all__ = ['build_indexes', 'sets_to_sqlite']
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +40,16 @@ def sets_to_sqlite(
         db_path: Path,
         data_objs: dict[str, Collection[APIResource]],
         *,
-        update: bool
+        update: bool,
+        build_indexes: bool = True
         ) -> None:
     """
     Save sets to SQLite3 database.
 
+    When ``build_indexes`` is :pt:`False`, query indexes and ``ANALYZE``
+    statistics are left untouched. A page-by-page save should skip them
+    for every page and call `build_indexes` once after the last page.
+
     Raises
     ------
     FileExistsError
@@ -57,7 +62,23 @@ def sets_to_sqlite(
         flags, data_objs['Filing'])
     con, table_schema = _create_database_or_extend_schema(
         flags, db_path, filing_data_attrs, update=update)
-    _insert_data(table_schema, data_objs, con)
+    _insert_data(table_schema, data_objs, con, update=update)
+    if build_indexes:
+        _create_indexes(table_schema.get('Filing', ()), con)
+    con.close()
+
+
+def build_indexes(db_path: Path) -> None:
+    """
+    Index an existing database and update its statistics.
+
+    Raises
+    ------
+    sqlite3.DatabaseError
+    """
+    con = sqlite3.connect(db_path)
+    filing_cols = _get_existing_column_names('Filing', con.cursor())
+    _create_indexes(filing_cols, con)
     con.close()
 
 
@@ -129,6 +150,12 @@ def _create_database_or_extend_schema(
 
     connection = sqlite3.connect(db_path)
     cur = connection.cursor()
+    if not update:
+        # A crash can only lose a database which did not exist before
+        # the call, so skip the rollback journal and fsyncs while
+        # building a fresh database.
+        _exec(cur, "PRAGMA journal_mode = MEMORY")
+        _exec(cur, "PRAGMA synchronous = OFF")
     required_table_names = {cls.__name__ for cls in resource_types}
     existing_tables: set[str] = set()
     existing_views: set[str] = set()
@@ -246,8 +273,13 @@ def _get_col_defs(cols: list[str]) -> list[tuple[str, str]]:
 def _insert_data(
         table_schema: _CurrentSchemaType,
         data_objs: dict[str, Collection[APIResource]],
-        con: sqlite3.Connection):
+        con: sqlite3.Connection,
+        *,
+        update: bool):
     cur = con.cursor()
+    # Resource api_id values are unique within a save, so a fresh
+    # database can skip the REPLACE primary key lookup.
+    verb = 'REPLACE' if update else 'INSERT'
     for table_name in table_schema:
         cols = table_schema[table_name]
         records: list[tuple[DataAttributeType, ...]] = []
@@ -264,10 +296,29 @@ def _insert_data(
         phs = ', '.join(['?'] * len(cols))
         _exec(
             cur,
-            f"REPLACE INTO {table_name} ({colsql})\nVALUES ({phs})",
+            f"{verb} INTO {table_name} ({colsql})\nVALUES ({phs})",
             many=records
             )
-        con.commit()
+    con.commit()
+
+
+_INDEXED_FILING_COLS = 'country', 'filing_index', 'processed_time'
+"""Columns of table ``Filing`` receiving an index on save."""
+
+
+def _create_indexes(
+        filing_cols: Collection[str], con: sqlite3.Connection):
+    """Index common Filing query columns and update statistics."""
+    cur = con.cursor()
+    for col in _INDEXED_FILING_COLS:
+        if col in filing_cols:
+            _exec(
+                cur,
+                f"CREATE INDEX IF NOT EXISTS idx_filing_{col} "
+                f"ON Filing ({col})"
+                )
+    _exec(cur, "ANALYZE")
+    con.commit()
 
 
 def _exec(
@@ -562,7 +562,8 @@ class FilingSet:
             update: bool = False,
             flags: ScopeFlag = (
                 ScopeFlag.GET_ENTITY
-                | ScopeFlag.GET_VALIDATION_MESSAGES)
+                | ScopeFlag.GET_VALIDATION_MESSAGES),
+            build_indexes: bool = True
             ) -> None:
         """
         Save set to an SQLite3 database.
@@ -586,6 +587,10 @@ class FilingSet:
             Scope of saving. Flag `GET_ENTITY` will save entity records
             of filings and `GET_VALIDATION_MESSAGES` the validation
             messages.
+        build_indexes : bool, default True
+            Create query speed indexes and update database statistics
+            after inserting. Set to :pt:`False` when the set is saved
+            in parts and index the database once after the last part.
 
         Raises
         ------
@@ -608,7 +613,8 @@ class FilingSet:
         data_objs, flags = self._get_data_sets(flags)
 
         database_processor.sets_to_sqlite(
-            flags, ppath, data_objs, update=update)
+            flags, ppath, data_objs, update=update,
+            build_indexes=build_indexes)
 
     def __repr__(self) -> str:
         """
@@ -85,7 +85,7 @@ from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from xbrl_filings_api import request_processor
+from xbrl_filings_api import database_processor, request_processor
 from xbrl_filings_api.constants import NO_LIMIT
 from xbrl_filings_api.filing_set import FilingSet
 from xbrl_filings_api.filings_page import FilingsPage
@@ -266,18 +266,26 @@ def to_sqlite(
 
     page_gen = request_processor.generate_pages(
         filters, limit, flags, res_colls, sort, add_api_params)
+    saved_pages = False
     for page in page_gen:
         page_filings = FilingSet(page.filing_list)
+        # Indexes are built once after the last page instead of
+        # reindexing after every page
         page_filings.to_sqlite(
             path=path,
             update=update,
-            flags=flags
+            flags=flags,
+            build_indexes=False
             )
         # ResourceCollection reads subresource references in FilingSet
         filings.update(page_filings)
         # After database creation, next pages are always added to
         # existing db
         update = True
+        saved_pages = True
+    if saved_pages:
+        ppath = path if isinstance(path, Path) else Path(path)
+        database_processor.build_indexes(ppath)
 
 
 def filing_page_iter(